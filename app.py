@@ -7,6 +7,7 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import json
+import zipfile
 from datetime import datetime
 from io import BytesIO
 
@@ -918,13 +919,14 @@ def display_export_options():
     with col1:
         export_format = st.selectbox(
             "Select Export Format",
-            options=['csv', 'excel', 'json', 'xml', 'txt'],
+            options=export_manager.supported_formats,
             format_func=lambda x: {
                 'csv': 'CSV (Comma Separated Values)',
                 'excel': 'Excel Spreadsheet (.xlsx)',
                 'json': 'JSON (JavaScript Object Notation)',
                 'xml': 'XML (Extensible Markup Language)',
-                'txt': 'Plain Text Report'
+                'txt': 'Plain Text Report',
+                'msgpack': 'MessagePack (Binary, for re-import)'
             }[x]
         )
     
@@ -950,7 +952,8 @@ def display_export_options():
                     'excel': 'xlsx',
                     'json': 'json',
                     'xml': 'xml',
-                    'txt': 'txt'
+                    'txt': 'txt',
+                    'msgpack': 'msgpack'
                 }
                 
                 mime_types = {
@@ -958,7 +961,8 @@ def display_export_options():
                     'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
                     'json': 'application/json',
                     'xml': 'application/xml',
-                    'txt': 'text/plain'
+                    'txt': 'text/plain',
+                    'msgpack': 'application/x-msgpack'
                 }
                 
                 st.download_button(
@@ -988,7 +992,8 @@ def display_export_options():
                         'excel': 'xlsx', 
                         'json': 'json',
                         'xml': 'xml',
-                        'txt': 'txt'
+                        'txt': 'txt',
+                        'msgpack': 'msgpack'
                     }
                     
                     mime_types = {
@@ -996,7 +1001,8 @@ def display_export_options():
                         'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
                         'json': 'application/json',
                         'xml': 'application/xml',
-                        'txt': 'text/plain'
+                        'txt': 'text/plain',
+                        'msgpack': 'application/x-msgpack'
                     }
                     
                     st.download_button(
@@ -1036,6 +1042,32 @@ def display_export_options():
             else:
                 st.warning("Need at least 2 calculations for comparison report.")
     
+    if st.button("🗂️ Export All Formats (ZIP)"):
+        try:
+            exports = export_manager.export_all_formats(
+                st.session_state.calculation_history,
+                include_charts
+            )
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            
+            zip_buffer = BytesIO()
+            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for fmt, export_buffer in exports.items():
+                    extension = 'xlsx' if fmt == 'excel' else fmt
+                    archive.writestr(f"valuation_data_{timestamp}.{extension}", export_buffer.getvalue())
+            
+            st.download_button(
+                label="💾 Download ZIP Archive",
+                data=zip_buffer.getvalue(),
+                file_name=f"valuation_data_{timestamp}.zip",
+                mime="application/zip"
+            )
+            
+            st.success(f"✅ {len(exports)} formats exported with {len(st.session_state.calculation_history)} calculations")
+            
+        except Exception as e:
+            st.error(f"Export failed: {str(e)}")
+    
     # Export metadata
     with st.expander("📋 Export Information"):
         metadata = export_manager.get_export_metadata(st.session_state.calculation_history)
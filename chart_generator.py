@@ -4,108 +4,231 @@ Creates interactive Plotly charts for different valuation methods
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+import copy
+import functools
+from types import SimpleNamespace
+from typing import Dict, List, Any, Tuple
+
+# Subplot grid specs and titles (static, shared across calls)
+_DCF_SPECS = [
+    [{"type": "bar"}, {"type": "bar"}],
+    [{"type": "pie"}, {"type": "scatter"}]
+]
+_TWO_BAR_SPECS = [[{"type": "bar"}, {"type": "bar"}]]
+_VC_INV_SPECS = [[{"type": "bar"}, {"type": "pie"}]]
+
+_DCF_TITLES = (
+    'Cash Flow Projections',
+    'Present Values',
+    'Valuation Breakdown',
+    'Cumulative Present Value'
+)
+_MULTIPLES_TITLES = ('Valuation Calculation', 'Industry Comparison')
+_SCORECARD_TITLES = ('Criteria Scores', 'Weight Contributions')
+_BERKUS_TITLES = ('Value by Criterion', 'Completion Percentage')
+_RISK_FACTOR_TITLES = ('Risk Ratings', 'Valuation Adjustments')
+_VC_INV_TITLES = ('Investment Structure', 'Ownership Split')
+_VC_RETURNS_TITLES = ('Value Comparison', 'Return Analysis')
+
+# Named subplot grids: (rows, cols, specs, subplot_titles)
+_SUBPLOT_GRIDS = {
+    'dcf': (2, 2, _DCF_SPECS, _DCF_TITLES),
+    'multiples': (1, 2, _TWO_BAR_SPECS, _MULTIPLES_TITLES),
+    'scorecard': (1, 2, _TWO_BAR_SPECS, _SCORECARD_TITLES),
+    'berkus': (1, 2, _TWO_BAR_SPECS, _BERKUS_TITLES),
+    'risk_factor': (1, 2, _TWO_BAR_SPECS, _RISK_FACTOR_TITLES),
+    'vc_investment': (1, 2, _VC_INV_SPECS, _VC_INV_TITLES),
+    'vc_returns': (1, 2, _TWO_BAR_SPECS, _VC_RETURNS_TITLES)
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _subplot_grid(name: str) -> Tuple[Dict, Tuple[Dict, ...]]:
+    """Build a named subplot grid once, returning its layout and per-cell trace refs"""
+    # Deferred import: only needed the first time each grid is built
+    from plotly.subplots import make_subplots
+    
+    rows, cols, specs, titles = _SUBPLOT_GRIDS[name]
+    grid = make_subplots(rows=rows, cols=cols, subplot_titles=titles, specs=specs)
+    
+    layout = grid.layout.to_plotly_json()
+    layout.pop('template', None)
+    
+    # Row-major axis/domain references for each cell
+    trace_refs = []
+    for row in range(1, rows + 1):
+        for col in range(1, cols + 1):
+            subplot = grid.get_subplot(row, col)
+            if hasattr(subplot, 'xaxis'):
+                trace_refs.append({'xaxis': subplot.yaxis.anchor, 'yaxis': subplot.xaxis.anchor})
+            else:
+                trace_refs.append({'domain': {'x': list(subplot.x), 'y': list(subplot.y)}})
+    
+    return layout, tuple(trace_refs)
+
+
+def _subplot_figure(name: str, traces: List, title: str, height: int, **layout_updates) -> go.Figure:
+    """Create a subplot figure with traces and layout in a single constructor call
+    
+    Keyword arguments are merged into the grid layout: dict values update the
+    matching axis entries, anything else replaces the key outright.
+    """
+    grid_layout, trace_refs = _subplot_grid(name)
+    
+    for trace, ref in zip(traces, trace_refs):
+        trace.update(ref)
+    
+    layout = copy.deepcopy(grid_layout)
+    layout.update(title=dict(text=title), showlegend=False, height=height)
+    for key, value in layout_updates.items():
+        if isinstance(value, dict) and key in layout:
+            layout[key].update(value)
+        else:
+            layout[key] = value
+    
+    # Traces and layout are built from fixed literals here, so skip re-validation
+    return go.Figure(data=traces, layout=layout, _validate=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _error_chart_template() -> Dict:
+    """Build the error chart figure once; only the annotation text varies per error"""
+    fig = go.Figure()
+    
+    fig.add_annotation(
+        text="",
+        xref="paper", yref="paper",
+        x=0.5, y=0.5,
+        xanchor='center', yanchor='middle',
+        showarrow=False,
+        font=dict(size=16, color="red")
+    )
+    
+    fig.update_layout(
+        title_text="Chart Error",
+        showlegend=False,
+        height=400,
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False)
+    )
+    
+    return fig.to_plotly_json()
+
+
+@functools.lru_cache(maxsize=32)
+def _year_labels(n: int) -> Tuple[str, ...]:
+    """Projection year labels: ('Year 1', ..., 'Year n')"""
+    return tuple(f"Year {i+1}" for i in range(n))
+
+
+@functools.lru_cache(maxsize=32)
+def _cumulative_year_labels(n: int) -> Tuple[str, ...]:
+    """Year labels prefixed with 'Start' for cumulative series"""
+    return ('Start',) + _year_labels(n)
+
+
+def _labeled_bar(name: str, labels: List[str], values: List[float],
+                 texts: List[str], colors: List[str]) -> Dict:
+    """Bar trace with one color and an outside text label per bar"""
+    return dict(
+        type='bar',
+        x=labels,
+        y=values,
+        name=name,
+        marker=dict(color=colors),
+        text=texts,
+        textposition='outside'
+    )
+
+
+def _zero_line(xref: str, yref: str) -> Dict:
+    """Dashed horizontal line at y=0 spanning a subplot"""
+    return dict(
+        type='line', xref=f'{xref} domain', yref=yref,
+        x0=0, x1=1, y0=0, y1=0,
+        line=dict(dash='dash', color='gray')
+    )
 
 class ChartGenerator:
     """Generate interactive charts for valuation results"""
     
     def __init__(self):
-        self.color_palette = {
-            'primary': '#1f77b4',
-            'secondary': '#ff7f0e',
-            'success': '#2ca02c',
-            'warning': '#d62728',
-            'info': '#9467bd',
-            'light': '#bcbd22'
-        }
+        self.color_palette = SimpleNamespace(
+            primary='#1f77b4',
+            secondary='#ff7f0e',
+            success='#2ca02c',
+            warning='#d62728',
+            info='#9467bd',
+            light='#bcbd22'
+        )
     
     def create_dcf_chart(self, result: Dict, cash_flows: List[float]) -> go.Figure:
         """Create DCF analysis charts"""
         try:
-            fig = make_subplots(
-                rows=2, cols=2,
-                subplot_titles=(
-                    'Cash Flow Projections',
-                    'Present Values',
-                    'Valuation Breakdown',
-                    'Cumulative Present Value'
-                ),
-                specs=[
-                    [{"type": "bar"}, {"type": "bar"}],
-                    [{"type": "pie"}, {"type": "scatter"}]
-                ]
-            )
+            traces = []
             
-            years = [f"Year {i+1}" for i in range(len(cash_flows))]
+            cash_flows = np.ascontiguousarray(cash_flows, dtype=np.float64)
+            discounted_flows = np.ascontiguousarray(result.get('discounted_flows', []), dtype=np.float64)
+            years = _year_labels(len(cash_flows))
             
             # Chart 1: Cash Flow Projections
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=years,
                     y=cash_flows,
                     name="Cash Flows",
-                    marker_color=self.color_palette['primary'],
+                    marker=dict(color=self.color_palette.primary),
                     text=[f"€{cf:,.0f}" for cf in cash_flows],
                     textposition='outside'
-                ),
-                row=1, col=1
+                )
             )
             
             # Chart 2: Present Values
-            discounted_flows = result.get('discounted_flows', [])
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=years,
                     y=discounted_flows,
                     name="Present Values",
-                    marker_color=self.color_palette['secondary'],
+                    marker=dict(color=self.color_palette.secondary),
                     text=[f"€{pv:,.0f}" for pv in discounted_flows],
                     textposition='outside'
-                ),
-                row=1, col=2
+                )
             )
             
             # Chart 3: Valuation Breakdown
             operating_value = result.get('operating_value', 0)
             terminal_value = result.get('terminal_pv', 0)
             
-            fig.add_trace(
-                go.Pie(
+            traces.append(
+                dict(
+                    type='pie',
                     labels=['Operating Value', 'Terminal Value'],
                     values=[operating_value, terminal_value],
                     hole=0.3,
-                    marker_colors=[self.color_palette['success'], self.color_palette['info']],
+                    marker=dict(colors=[self.color_palette.success, self.color_palette.info]),
                     textinfo='label+percent+value',
                     texttemplate='%{label}<br>%{percent}<br>€%{value:,.0f}'
-                ),
-                row=2, col=1
+                )
             )
             
             # Chart 4: Cumulative Present Value
-            cumulative_pv = np.cumsum([0] + discounted_flows)
-            fig.add_trace(
-                go.Scatter(
-                    x=['Start'] + years,
+            cumulative_pv = np.concatenate(([0.0], np.cumsum(discounted_flows)))
+            traces.append(
+                dict(
+                    type='scatter',
+                    x=_cumulative_year_labels(len(cash_flows)),
                     y=cumulative_pv,
                     mode='lines+markers',
                     name="Cumulative PV",
-                    line=dict(color=self.color_palette['primary'], width=3),
+                    line=dict(color=self.color_palette.primary, width=3),
                     marker=dict(size=8)
-                ),
-                row=2, col=2
+                )
             )
             
-            fig.update_layout(
-                title_text="DCF Valuation Analysis",
-                showlegend=False,
-                height=600
-            )
-            
-            return fig
+            return _subplot_figure('dcf', traces, "DCF Valuation Analysis", 600)
             
         except Exception as e:
             return self._create_error_chart(f"DCF chart generation failed: {str(e)}")
@@ -116,69 +239,62 @@ class ChartGenerator:
             # Import here to avoid circular import
             from data_models import SECTOR_MULTIPLES
             
-            fig = make_subplots(
-                rows=1, cols=2,
-                subplot_titles=('Valuation Calculation', 'Industry Comparison'),
-                specs=[[{"type": "bar"}, {"type": "bar"}]]
-            )
+            traces = []
             
             # Chart 1: Valuation breakdown
             metric_value = result.get('metric', 0)
             multiple = result.get('multiple', 0)
             valuation = result.get('valuation', 0)
             
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=['Base Metric', 'Applied Multiple', 'Valuation'],
                     y=[metric_value, multiple, valuation],
                     name="Calculation",
-                    marker_color=[
-                        self.color_palette['primary'],
-                        self.color_palette['secondary'],
-                        self.color_palette['success']
-                    ],
+                    marker=dict(color=[
+                        self.color_palette.primary,
+                        self.color_palette.secondary,
+                        self.color_palette.success
+                    ]),
                     text=[
                         f"€{metric_value:,.0f}",
                         f"{multiple:.1f}x",
                         f"€{valuation:,.0f}"
                     ],
                     textposition='outside'
-                ),
-                row=1, col=1
+                )
             )
             
             # Chart 2: Industry comparison
             metric_type = result.get('metric_type', 'Revenue')
             sectors = list(SECTOR_MULTIPLES.keys())
-            multiples = [SECTOR_MULTIPLES[s][metric_type] for s in sectors]
+            multiples = np.fromiter(
+                (SECTOR_MULTIPLES[s][metric_type] for s in sectors), dtype=np.float64, count=len(sectors)
+            )
             
             colors = [
-                self.color_palette['warning'] if s == sector else self.color_palette['light']
+                self.color_palette.warning if s == sector else self.color_palette.light
                 for s in sectors
             ]
             
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=sectors,
                     y=multiples,
                     name=f"{metric_type} Multiples",
-                    marker_color=colors,
+                    marker=dict(color=colors),
                     text=[f"{m:.1f}x" for m in multiples],
                     textposition='outside'
-                ),
-                row=1, col=2
-            )
-            
-            fig.update_layout(
-                title_text=f"Market Multiples Analysis - {sector}",
-                showlegend=False,
-                height=400
+                )
             )
             
             # Rotate x-axis labels for better readability
-            fig.update_xaxes(tickangle=45, row=1, col=2)
-            
-            return fig
+            return _subplot_figure(
+                'multiples', traces, f"Market Multiples Analysis - {sector}", 400,
+                xaxis2=dict(tickangle=45)
+            )
             
         except Exception as e:
             return self._create_error_chart(f"Multiples chart generation failed: {str(e)}")
@@ -188,126 +304,110 @@ class ChartGenerator:
         try:
             criteria_analysis = result.get('criteria_analysis', {})
             
-            fig = make_subplots(
-                rows=1, cols=2,
-                subplot_titles=('Criteria Scores', 'Weight Contributions'),
-                specs=[[{"type": "bar"}, {"type": "bar"}]]
-            )
+            traces = []
             
-            criteria_names = []
-            scores = []
-            weights = []
-            contributions = []
+            # Single preallocated pass over the criteria
+            n = len(criteria_analysis)
+            criteria_names = [None] * n
+            scores = np.empty(n)
+            weights = np.empty(n)
+            contributions = np.empty(n)
             
-            for criterion, data in criteria_analysis.items():
-                criteria_names.append(criterion.title())
-                scores.append(data['score'])
-                weights.append(data['weight'] * 100)  # Convert to percentage
-                contributions.append(data['contribution'])
+            for i, (criterion, data) in enumerate(criteria_analysis.items()):
+                criteria_names[i] = criterion.title()
+                scores[i] = data['score']
+                weights[i] = data['weight'] * 100  # Convert to percentage
+                contributions[i] = data['contribution']
             
             # Chart 1: Criteria scores
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=criteria_names,
                     y=scores,
                     name="Scores",
-                    marker_color=self.color_palette['primary'],
-                    text=[f"{s}/5" for s in scores],
+                    marker=dict(color=self.color_palette.primary),
+                    text=[f"{s:g}/5" for s in scores],
                     textposition='outside'
-                ),
-                row=1, col=1
+                )
             )
             
             # Chart 2: Weight contributions
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=criteria_names,
                     y=contributions,
                     name="Weighted Contributions",
-                    marker_color=self.color_palette['secondary'],
+                    marker=dict(color=self.color_palette.secondary),
                     text=[f"{c:.3f}" for c in contributions],
                     textposition='outside'
-                ),
-                row=1, col=2
+                )
             )
             
-            fig.update_layout(
-                title_text="Scorecard Method Analysis",
-                showlegend=False,
-                height=400
+            return _subplot_figure(
+                'scorecard', traces, "Scorecard Method Analysis", 400,
+                yaxis=dict(range=[0, 5.5], title=dict(text="Score (0-5)")),
+                yaxis2=dict(title=dict(text="Contribution Factor"))
             )
             
-            # Set y-axis ranges
-            fig.update_yaxes(range=[0, 5.5], row=1, col=1, title_text="Score (0-5)")
-            fig.update_yaxes(title_text="Contribution Factor", row=1, col=2)
-            
-            return fig
-            
         except Exception as e:
             return self._create_error_chart(f"Scorecard chart generation failed: {str(e)}")
     
     def create_berkus_chart(self, result: Dict) -> go.Figure:
         """Create Berkus method visualization"""
         try:
+            # Import here to avoid circular import
+            from data_models import BERKUS_KEYS, BERKUS_NAMES, BERKUS_MAX_VALUES
+            
             breakdown = result.get('breakdown', {})
             
-            criteria_names = []
-            scores = []
-            values = []
-            max_values = []
-            
-            for criterion, data in breakdown.items():
-                criteria_names.append(data['name'])
-                scores.append(data['score'])
-                values.append(data['value'])
-                max_values.append(500000)  # Max per criterion
-            
-            fig = make_subplots(
-                rows=1, cols=2,
-                subplot_titles=('Value by Criterion', 'Completion Percentage'),
-                specs=[[{"type": "bar"}, {"type": "bar"}]]
+            # Align breakdown values with the precomputed criterion columns
+            present = np.fromiter((k in breakdown for k in BERKUS_KEYS), dtype=bool, count=len(BERKUS_KEYS))
+            criteria_names = BERKUS_NAMES[present]
+            max_values = BERKUS_MAX_VALUES[present]
+            values = np.fromiter(
+                (breakdown[k]['value'] for k in BERKUS_KEYS if k in breakdown),
+                dtype=np.float64, count=len(criteria_names)
             )
             
+            traces = []
+            
             # Chart 1: Values by criterion
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=criteria_names,
                     y=values,
                     name="Criterion Values",
-                    marker_color=self.color_palette['success'],
+                    marker=dict(color=self.color_palette.success),
                     text=[f"€{v:,.0f}" for v in values],
                     textposition='outside'
-                ),
-                row=1, col=1
+                )
             )
             
             # Chart 2: Completion percentages
-            percentages = [(v/500000)*100 for v in values]
-            fig.add_trace(
-                go.Bar(
+            percentages = values * (100.0 / max_values)
+            traces.append(
+                dict(
+                    type='bar',
                     x=criteria_names,
                     y=percentages,
                     name="Completion %",
-                    marker_color=self.color_palette['info'],
+                    marker=dict(color=self.color_palette.info),
                     text=[f"{p:.1f}%" for p in percentages],
                     textposition='outside'
-                ),
-                row=1, col=2
+                )
             )
             
-            fig.update_layout(
-                title_text="Berkus Method Analysis",
-                showlegend=False,
-                height=400
+            return _subplot_figure(
+                'berkus', traces, "Berkus Method Analysis", 400,
+                xaxis=dict(tickangle=45),
+                xaxis2=dict(tickangle=45),
+                yaxis=dict(title=dict(text="Value (€)")),
+                yaxis2=dict(title=dict(text="Completion (%)"), range=[0, 105])
             )
             
-            # Update axes
-            fig.update_xaxes(tickangle=45)
-            fig.update_yaxes(title_text="Value (€)", row=1, col=1)
-            fig.update_yaxes(title_text="Completion (%)", range=[0, 105], row=1, col=2)
-            
-            return fig
-            
         except Exception as e:
             return self._create_error_chart(f"Berkus chart generation failed: {str(e)}")
     
@@ -316,78 +416,55 @@ class ChartGenerator:
         try:
             risk_analysis = result.get('risk_analysis', {})
             
-            risk_names = []
-            ratings = []
-            adjustments = []
+            n = len(risk_analysis)
+            risk_names = [data['name'] for data in risk_analysis.values()]
+            ratings = np.fromiter((data['rating'] for data in risk_analysis.values()), dtype=np.int32, count=n)
+            adjustments = np.fromiter(
+                (data['adjustment'] for data in risk_analysis.values()), dtype=np.float64, count=n
+            ) * 100  # Convert to percentage
             
-            for factor, data in risk_analysis.items():
-                risk_names.append(data['name'])
-                ratings.append(data['rating'])
-                adjustments.append(data['adjustment'] * 100)  # Convert to percentage
-            
-            fig = make_subplots(
-                rows=1, cols=2,
-                subplot_titles=('Risk Ratings', 'Valuation Adjustments'),
-                specs=[[{"type": "bar"}, {"type": "bar"}]]
-            )
+            traces = []
             
             # Chart 1: Risk ratings
-            colors_ratings = [
-                self.color_palette['warning'] if r < 0 else 
-                self.color_palette['success'] if r > 0 else 
-                self.color_palette['light']
-                for r in ratings
-            ]
+            colors_ratings = self._sign_colors(ratings)
             
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=risk_names,
                     y=ratings,
                     name="Risk Ratings",
-                    marker_color=colors_ratings,
+                    marker=dict(color=colors_ratings),
                     text=[f"{r:+d}" for r in ratings],
                     textposition='outside'
-                ),
-                row=1, col=1
+                )
             )
             
             # Chart 2: Adjustments
-            colors_adj = [
-                self.color_palette['warning'] if a < 0 else 
-                self.color_palette['success'] if a > 0 else 
-                self.color_palette['light']
-                for a in adjustments
-            ]
+            colors_adj = self._sign_colors(adjustments)
             
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type='bar',
                     x=risk_names,
                     y=adjustments,
                     name="Adjustments",
-                    marker_color=colors_adj,
+                    marker=dict(color=colors_adj),
                     text=[f"{a:+.1f}%" for a in adjustments],
                     textposition='outside'
-                ),
-                row=1, col=2
+                )
             )
             
-            fig.update_layout(
-                title_text="Risk Factor Analysis",
-                showlegend=False,
-                height=400
+            # Horizontal dashed line at zero on both panels
+            return _subplot_figure(
+                'risk_factor', traces, "Risk Factor Analysis", 400,
+                xaxis=dict(tickangle=45),
+                xaxis2=dict(tickangle=45),
+                yaxis=dict(title=dict(text="Rating (-2 to +2)"), range=[-2.5, 2.5]),
+                yaxis2=dict(title=dict(text="Adjustment (%)")),
+                shapes=[_zero_line('x', 'y'), _zero_line('x2', 'y2')]
             )
             
-            # Update axes
-            fig.update_xaxes(tickangle=45)
-            fig.update_yaxes(title_text="Rating (-2 to +2)", range=[-2.5, 2.5], row=1, col=1)
-            fig.update_yaxes(title_text="Adjustment (%)", row=1, col=2)
-            
-            # Add horizontal line at zero
-            fig.add_hline(y=0, line_dash="dash", line_color="gray", row=1, col=1)
-            fig.add_hline(y=0, line_dash="dash", line_color="gray", row=1, col=2)
-            
-            return fig
-            
         except Exception as e:
             return self._create_error_chart(f"Risk factor chart generation failed: {str(e)}")
     
@@ -407,125 +484,74 @@ class ChartGenerator:
         pre_money = result.get('pre_money_valuation', 0)
         investment = result.get('investment_needed', 0)
         post_money = result.get('post_money_valuation', 0)
-        
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('Investment Structure', 'Ownership Split'),
-            specs=[[{"type": "bar"}, {"type": "pie"}]]
-        )
-        
-        # Chart 1: Investment structure
-        fig.add_trace(
-            go.Bar(
-                x=['Pre-Money', 'Investment', 'Post-Money'],
-                y=[pre_money, investment, post_money],
-                name="Valuation",
-                marker_color=[
-                    self.color_palette['primary'],
-                    self.color_palette['secondary'],
-                    self.color_palette['success']
-                ],
-                text=[
-                    f"€{pre_money:,.0f}",
-                    f"€{investment:,.0f}",
-                    f"€{post_money:,.0f}"
-                ],
-                textposition='outside'
-            ),
-            row=1, col=1
-        )
-        
-        # Chart 2: Ownership split
         ownership_pct = result.get('ownership_percentage', 0) * 100
         founder_pct = 100 - ownership_pct
         
-        fig.add_trace(
-            go.Pie(
+        return self._two_panel_figure(
+            'vc_investment', "VC Investment Analysis",
+            # Chart 1: Investment structure
+            _labeled_bar(
+                "Valuation",
+                ['Pre-Money', 'Investment', 'Post-Money'],
+                [pre_money, investment, post_money],
+                [f"€{pre_money:,.0f}", f"€{investment:,.0f}", f"€{post_money:,.0f}"],
+                [self.color_palette.primary, self.color_palette.secondary, self.color_palette.success]
+            ),
+            # Chart 2: Ownership split
+            dict(
+                type='pie',
                 labels=['Founders', 'Investors'],
                 values=[founder_pct, ownership_pct],
                 hole=0.3,
-                marker_colors=[self.color_palette['primary'], self.color_palette['secondary']],
+                marker=dict(colors=[self.color_palette.primary, self.color_palette.secondary]),
                 textinfo='label+percent',
                 texttemplate='%{label}<br>%{percent}'
-            ),
-            row=1, col=2
-        )
-        
-        fig.update_layout(
-            title_text="VC Investment Analysis",
-            showlegend=False,
-            height=400
+            )
         )
-        
-        return fig
     
     def _create_vc_returns_chart(self, result: Dict) -> go.Figure:
         """Create VC returns analysis chart"""
         present_value = result.get('present_value', 0)
         exit_value = result.get('exit_value', 0)
         return_multiple = result.get('expected_return_multiple', 0)
-        
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('Value Comparison', 'Return Analysis'),
-            specs=[[{"type": "bar"}, {"type": "bar"}]]
-        )
-        
-        # Chart 1: Value comparison
-        fig.add_trace(
-            go.Bar(
-                x=['Present Value', 'Exit Value'],
-                y=[present_value, exit_value],
-                name="Values",
-                marker_color=[self.color_palette['primary'], self.color_palette['success']],
-                text=[f"€{present_value:,.0f}", f"€{exit_value:,.0f}"],
-                textposition='outside'
-            ),
-            row=1, col=1
-        )
-        
-        # Chart 2: Return metrics
         annualized_return = result.get('annualized_return', 0) * 100
         
-        fig.add_trace(
-            go.Bar(
-                x=['Return Multiple', 'Annualized Return %'],
-                y=[return_multiple, annualized_return],
-                name="Returns",
-                marker_color=[self.color_palette['info'], self.color_palette['warning']],
-                text=[f"{return_multiple:.1f}x", f"{annualized_return:.1f}%"],
-                textposition='outside'
+        return self._two_panel_figure(
+            'vc_returns', "VC Returns Analysis",
+            # Chart 1: Value comparison
+            _labeled_bar(
+                "Values",
+                ['Present Value', 'Exit Value'],
+                [present_value, exit_value],
+                [f"€{present_value:,.0f}", f"€{exit_value:,.0f}"],
+                [self.color_palette.primary, self.color_palette.success]
             ),
-            row=1, col=2
-        )
-        
-        fig.update_layout(
-            title_text="VC Returns Analysis",
-            showlegend=False,
-            height=400
+            # Chart 2: Return metrics
+            _labeled_bar(
+                "Returns",
+                ['Return Multiple', 'Annualized Return %'],
+                [return_multiple, annualized_return],
+                [f"{return_multiple:.1f}x", f"{annualized_return:.1f}%"],
+                [self.color_palette.info, self.color_palette.warning]
+            )
         )
-        
-        return fig
+    
+    def _two_panel_figure(self, grid: str, title: str, left_trace: Dict, right_trace: Dict) -> go.Figure:
+        """Create a 1x2 side-by-side figure on a cached subplot grid"""
+        return _subplot_figure(grid, [left_trace, right_trace], title, 400)
+    
+    def _sign_colors(self, values: List[float]) -> List[str]:
+        """Map negative/positive/zero values to warning/success/light colors"""
+        values_arr = np.asarray(values)
+        return np.select(
+            [values_arr < 0, values_arr > 0],
+            [self.color_palette.warning, self.color_palette.success],
+            default=self.color_palette.light
+        ).tolist()
     
     def _create_error_chart(self, error_message: str) -> go.Figure:
         """Create error message chart"""
-        fig = go.Figure()
-        
-        fig.add_annotation(
-            text=f"Chart Generation Error:<br>{error_message}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            xanchor='center', yanchor='middle',
-            showarrow=False,
-            font=dict(size=16, color="red")
-        )
-        
-        fig.update_layout(
-            title_text="Chart Error",
-            showlegend=False,
-            height=400,
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False)
-        )
+        figure_dict = copy.deepcopy(_error_chart_template())
+        figure_dict['layout']['annotations'][0]['text'] = f"Chart Generation Error:<br>{error_message}"
         
-        return fig
+        return go.Figure(figure_dict, skip_invalid=True)
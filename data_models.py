@@ -4,8 +4,11 @@ Contains data structures, constants, and validation models
 """
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+import numpy as np
+
 # Sector multiples data for market comparison
 SECTOR_MULTIPLES = {
     "Technology": {"Revenue": 6.5, "EBITDA": 15.2},
@@ -25,20 +28,20 @@ SECTOR_MULTIPLES = {
     "Real Estate": {"Revenue": 3.4, "EBITDA": 9.7}
 }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of input validation"""
     is_valid: bool
     error_message: str = ""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValuationInput:
     """Base class for valuation inputs"""
     method: str
     timestamp: str
     user_inputs: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DCFInputs(ValuationInput):
     """DCF method specific inputs"""
     cash_flows: list
@@ -46,7 +49,7 @@ class DCFInputs(ValuationInput):
     terminal_growth: float
     growth_rate: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MultiplesInputs(ValuationInput):
     """Market multiples method inputs"""
     sector: str
@@ -54,25 +57,25 @@ class MultiplesInputs(ValuationInput):
     metric_value: float
     multiple: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScorecardInputs(ValuationInput):
     """Scorecard method inputs"""
     base_valuation: float
     criteria_scores: Dict[str, int]
     criteria_weights: Optional[Dict[str, float]] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BerkusInputs(ValuationInput):
     """Berkus method inputs"""
     criteria_scores: Dict[str, int]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskFactorInputs(ValuationInput):
     """Risk factor summation inputs"""
     base_valuation: float
     risk_factors: Dict[str, int]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VCMethodInputs(ValuationInput):
     """Venture capital method inputs"""
     expected_revenue: float
@@ -81,7 +84,7 @@ class VCMethodInputs(ValuationInput):
     years_to_exit: int
     investment_needed: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValuationResult:
     """Base valuation result"""
     method: str
@@ -118,7 +121,7 @@ DEFAULT_SCORECARD_WEIGHTS = {
 }
 
 # Berkus criteria definitions
-BERKUS_CRITERIA = {
+BERKUS_CRITERIA = MappingProxyType({
     "concept": {
         "name": "Sound Idea (Basic Value)",
         "description": "Quality and market potential of the core business concept",
@@ -144,10 +147,15 @@ BERKUS_CRITERIA = {
         "description": "Evidence of product-market fit through sales or user adoption",
         "max_value": 500000
     }
-}
+})
+
+# Berkus criteria as aligned columns (same order as BERKUS_CRITERIA)
+BERKUS_KEYS = tuple(BERKUS_CRITERIA)
+BERKUS_NAMES = np.array([c["name"] for c in BERKUS_CRITERIA.values()])
+BERKUS_MAX_VALUES = np.array([c["max_value"] for c in BERKUS_CRITERIA.values()], dtype=np.float64)
 
 # Risk factor categories for risk factor summation
-RISK_FACTOR_CATEGORIES = {
+RISK_FACTOR_CATEGORIES = MappingProxyType({
     "management": {
         "name": "Management Team Risk",
         "description": "Risk related to management experience and capabilities"
@@ -196,10 +204,10 @@ RISK_FACTOR_CATEGORIES = {
         "name": "Exit Strategy Risk",
         "description": "Risk related to potential exit opportunities and liquidity"
     }
-}
+})
 
 # Scorecard criteria definitions
-SCORECARD_CRITERIA = {
+SCORECARD_CRITERIA = MappingProxyType({
     "team": {
         "name": "Management Team Quality",
         "description": "Experience, track record, and capabilities of the team",
@@ -230,7 +238,7 @@ SCORECARD_CRITERIA = {
         "description": "Intellectual property, legal structure, and compliance",
         "weight": 0.10
     }
-}
+})
 
 # Application constants
 APP_TITLE = "Startup Valuation Calculator"
@@ -262,8 +270,8 @@ PDF_SETTINGS = {
     'font_size_small': 10
 }
 
-# Error messages
-ERROR_MESSAGES = {
+# Error messages (read-only; formatted once at import)
+ERROR_MESSAGES = MappingProxyType({
     'invalid_cash_flows': "Cash flows must be positive numbers",
     'invalid_discount_rate': f"Discount rate must be between {MIN_DISCOUNT_RATE*100:.0f}% and {MAX_DISCOUNT_RATE*100:.0f}%",
     'invalid_terminal_growth': f"Terminal growth must be between {MIN_TERMINAL_GROWTH*100:.0f}% and {MAX_TERMINAL_GROWTH*100:.0f}%",
@@ -274,4 +282,4 @@ ERROR_MESSAGES = {
     'calculation_failed': "Calculation failed due to invalid inputs",
     'pdf_generation_failed': "PDF report generation failed",
     'chart_generation_failed': "Chart generation failed"
-}
+})
@@ -3,103 +3,346 @@ Export Manager Module - Simplified Version
 Handles export functionality for multiple formats with reliable implementation
 """
 
-import pandas as pd
 import json
-import xml.etree.ElementTree as ET
+import numpy as np
+import xlsxwriter
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from io import BytesIO, StringIO
 import csv
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import math
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional fast JSON encoder; fall back to stdlib json
+    orjson = None
+
+# datetime, numpy and dataclass values serialize natively, leaving default=str
+# for the rare Decimal-like value. OPT_PASSTHROUGH_SUBCLASS is deliberately not
+# set: it would route dict/list/float subclasses through default=str as strings.
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else 0
+)
+
+try:
+    import msgpack
+except ImportError:  # Optional binary format for programmatic re-import
+    msgpack = None
+
+from xml.sax.saxutils import escape as xml_escape
+
+
+def _json_default(obj: Any) -> str:
+    """Fallback serializer for the stdlib json encoder"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Fallback serializer for msgpack; keeps numpy numbers numeric"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return _json_default(obj)
+
+
+def _dcf_csv_fields(row: Dict, result: Dict, inputs: Dict):
+    row['Operating_Value'] = result.get('operating_value', 0)
+    row['Terminal_Value'] = result.get('terminal_pv', 0)
+    row['Discount_Rate'] = inputs.get('discount_rate', 0)
+    row['Terminal_Growth'] = inputs.get('terminal_growth', 0)
+
+
+def _multiples_csv_fields(row: Dict, result: Dict, inputs: Dict):
+    row['Sector'] = inputs.get('sector', '')
+    row['Metric_Type'] = inputs.get('metric_type', '')
+    row['Metric_Value'] = inputs.get('metric_value', 0)
+    row['Multiple'] = inputs.get('multiple', 0)
+
+
+def _scorecard_csv_fields(row: Dict, result: Dict, inputs: Dict):
+    row['Base_Valuation'] = inputs.get('base_valuation', 0)
+    row['Adjustment_Factor'] = result.get('adjustment_factor', 1.0)
+
+
+def _berkus_csv_fields(row: Dict, result: Dict, inputs: Dict):
+    breakdown = result.get('breakdown', {})
+    for criteria, details in breakdown.items():
+        row[f'Berkus_{criteria}'] = details.get('value', 0)
+
+
+def _risk_factor_csv_fields(row: Dict, result: Dict, inputs: Dict):
+    row['Base_Valuation'] = inputs.get('base_valuation', 0)
+    row['Total_Adjustment'] = result.get('total_adjustment', 0)
+
+
+def _vc_csv_fields(row: Dict, result: Dict, inputs: Dict):
+    row['Exit_Value'] = result.get('exit_value', 0)
+    row['Present_Value'] = result.get('present_value', 0)
+    row['Required_Return'] = inputs.get('required_return', 0)
+    row['Years_to_Exit'] = inputs.get('years_to_exit', 0)
+
+
+def _write_xml_text(write, tag: bytes, value: Any, escape_cache: Dict[str, bytes]):
+    """Write a text-only XML element, reusing previously escaped values"""
+    text = str(value)
+    if not text:
+        write(b'<' + tag + b' />')
+        return
+    escaped = escape_cache.get(text)
+    if escaped is None:
+        escaped = escape_cache[text] = xml_escape(text).encode('utf-8')
+    write(b'<' + tag + b'>' + escaped + b'</' + tag + b'>')
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _xml_tag(key: Any) -> bytes:
+    """Sanitized XML tag for a dict key; keys come from a small fixed schema"""
+    return str(key).replace(' ', '_').encode('utf-8')
+
+
+@lru_cache(maxsize=256)
+def _xml_item_tag(index: int) -> bytes:
+    """XML tag for the index-th item of a list"""
+    return f'Item_{index}'.encode('utf-8')
+
+
+def _xml_dict_children(data: Dict):
+    """Yield (tag, value) pairs for a dict's entries"""
+    for key, value in data.items():
+        yield _xml_tag(key), value
+
+
+def _xml_list_children(items: List):
+    """Yield (tag, value) pairs for a list's items"""
+    for i, item in enumerate(items):
+        yield _xml_item_tag(i), item
+
+
+# Result keys already shown in the TXT calculation header
+_TXT_SKIPPED_RESULT_KEYS = frozenset(('success', 'method'))
+
+
+@lru_cache(maxsize=256)
+def _is_currency_key(key: str) -> bool:
+    """Whether a numeric result field is rendered as a dollar amount in TXT exports"""
+    lowered = key.lower()
+    return 'value' in lowered or 'valuation' in lowered
+
+
+# Approximate chunk size yielded by the streaming CSV exporter
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Below this many rows Excel exports skip xlsxwriter's temp-file streaming
+_EXCEL_IN_MEMORY_ROWS = 500
+
+
+def _csv_float_columns(header: List[str], rows: List[Dict]) -> List[bool]:
+    """Flag the columns pandas stored as float64: numeric with a float or a gap"""
+    flags = []
+    for key in header:
+        has_float = False
+        for row in rows:
+            value = row.get(key)
+            if value is None or isinstance(value, (float, np.floating)):
+                has_float = True
+            elif isinstance(value, bool) or not isinstance(value, (int, np.integer)):
+                has_float = False
+                break
+        flags.append(has_float)
+    return flags
+
+
+def _csv_cell(value: Any, as_float: bool) -> Any:
+    """CSV field text as pandas wrote it: blank for missing, 5.0 in float columns"""
+    if value is None or value != value:
+        return ''
+    return repr(float(value)) if as_float else value
+
+
+def _excel_cell(value: Any) -> Any:
+    """Map NaN to a blank cell and +/-inf to text, as the pandas Excel writer did"""
+    if isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        if math.isnan(value):
+            return None
+        return 'inf' if value > 0 else '-inf'
+    return value
+
+
+# Method name -> handler adding that method's columns to a CSV/Excel row
+_CSV_HANDLERS = {
+    'DCF': _dcf_csv_fields,
+    'Market Multiples': _multiples_csv_fields,
+    'Scorecard': _scorecard_csv_fields,
+    'Berkus': _berkus_csv_fields,
+    'Risk Factor Summation': _risk_factor_csv_fields,
+    'Venture Capital': _vc_csv_fields
+}
+
 
 class ExportManager:
     """Manages export functionality for valuation data in multiple formats"""
     
     def __init__(self):
         self.supported_formats = ['csv', 'excel', 'json', 'xml', 'txt']
+        if msgpack is not None:
+            self.supported_formats.append('msgpack')
     
     def export_calculation_data(
         self, 
         calculation_history: List[Dict[str, Any]], 
         format_type: str,
-        include_charts: bool = False
+        include_charts: bool = False,
+        compress: bool = False
     ) -> BytesIO:
-        """Export calculation data in specified format"""
+        """Export calculation data in specified format
+        
+        With compress=True the payload is gzip-compressed (serve as application/gzip).
+        """
         if format_type not in self.supported_formats:
             raise ValueError(f"Unsupported format: {format_type}")
         
         if format_type == 'csv':
-            return self._export_csv(calculation_history, include_charts)
+            buffer = self._export_csv(calculation_history, include_charts)
         elif format_type == 'excel':
-            return self._export_excel(calculation_history, include_charts)
+            buffer = self._export_excel(calculation_history, include_charts)
         elif format_type == 'json':
-            return self._export_json(calculation_history, include_charts)
+            buffer = self._export_json(calculation_history, include_charts)
         elif format_type == 'xml':
-            return self._export_xml(calculation_history, include_charts)
+            buffer = self._export_xml(calculation_history, include_charts)
         elif format_type == 'txt':
-            return self._export_txt(calculation_history, include_charts)
+            buffer = self._export_txt(calculation_history, include_charts)
+        elif format_type == 'msgpack':
+            buffer = self._export_msgpack(calculation_history, include_charts)
         else:
-            return self._export_json(calculation_history, include_charts)
+            buffer = self._export_json(calculation_history, include_charts)
+        
+        if compress:
+            # Level 1 keeps most of the size reduction at a fraction of the CPU cost
+            return BytesIO(gzip.compress(buffer.getbuffer(), compresslevel=1))
+        return buffer
     
-    def _export_csv(self, calculation_history: List[Dict], include_charts: bool) -> BytesIO:
-        """Export data as CSV format"""
-        buffer = BytesIO()
+    def export_all_formats(
+        self,
+        calculation_history: List[Dict[str, Any]],
+        include_charts: bool = False
+    ) -> Dict[str, BytesIO]:
+        """Export calculation data in every supported format concurrently"""
+        # CSV and Excel share one row-building pass
+        table = self._build_rows(calculation_history)
+        exporters = {
+            'csv': lambda: self._export_csv(calculation_history, include_charts, table),
+            'excel': lambda: self._export_excel(calculation_history, include_charts, table),
+            'json': lambda: self._export_json(calculation_history, include_charts),
+            'xml': lambda: self._export_xml(calculation_history, include_charts),
+            'txt': lambda: self._export_txt(calculation_history, include_charts)
+        }
+        if msgpack is not None:
+            exporters['msgpack'] = lambda: self._export_msgpack(calculation_history, include_charts)
         
-        # Prepare data for CSV export
-        csv_data = []
+        with ThreadPoolExecutor(max_workers=len(exporters)) as executor:
+            futures = {fmt: executor.submit(export) for fmt, export in exporters.items()}
+            return {fmt: future.result() for fmt, future in futures.items()}
+    
+    def _export_csv(
+        self,
+        calculation_history: List[Dict],
+        include_charts: bool,
+        table: Optional[Tuple[List[str], List[Dict]]] = None
+    ) -> BytesIO:
+        """Export data as CSV format"""
+        return BytesIO(b''.join(self._iter_export_csv(calculation_history, include_charts, table)))
+    
+    def _iter_export_csv(
+        self,
+        calculation_history: List[Dict],
+        include_charts: bool,
+        table: Optional[Tuple[List[str], List[Dict]]] = None
+    ) -> Iterator[bytes]:
+        """Yield the CSV export in chunks of roughly _STREAM_CHUNK_SIZE bytes"""
+        header, rows = table or self._build_rows(calculation_history)
+        if not rows:
+            return
         
-        for calc in calculation_history:
-            row = {
-                'Timestamp': calc.get('timestamp', ''),
-                'Method': calc.get('method', ''),
-                'Valuation': calc.get('valuation', 0),
-                'Success': calc.get('result', {}).get('success', False)
-            }
-            
-            # Add method-specific data
-            self._add_method_specific_csv_data(row, calc)
-            csv_data.append(row)
+        # Write rows straight through csv.writer; no DataFrame needed
+        float_columns = list(zip(header, _csv_float_columns(header, rows)))
+        text = StringIO()
+        writer = csv.writer(text, lineterminator='\n')
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow([_csv_cell(row.get(key), as_float) for key, as_float in float_columns])
+            if text.tell() >= _STREAM_CHUNK_SIZE:
+                yield text.getvalue().encode('utf-8')
+                text.seek(0)
+                text.truncate()
+        yield text.getvalue().encode('utf-8')
+    
+    def _export_excel(
+        self,
+        calculation_history: List[Dict],
+        include_charts: bool,
+        table: Optional[Tuple[List[str], List[Dict]]] = None
+    ) -> BytesIO:
+        """Export data as Excel format"""
+        header, rows = table or self._build_rows(calculation_history)
         
-        if csv_data:
-            df = pd.DataFrame(csv_data)
-            csv_string = df.to_csv(index=False)
-            buffer.write(csv_string.encode('utf-8'))
+        # Create Excel file in memory
+        buffer = BytesIO()
+        if rows:
+            # Write cells with xlsxwriter directly. Small sheets stay entirely in
+            # memory; larger ones use constant_memory, which flushes each row to a
+            # temp file as soon as the next one starts instead of holding the sheet
+            if len(rows) < _EXCEL_IN_MEMORY_ROWS:
+                options = {'in_memory': True}
+            else:
+                options = {'constant_memory': True}
+            workbook = xlsxwriter.Workbook(buffer, options)
+            worksheet = workbook.add_worksheet('Valuations')
+            worksheet.write_row(0, 0, header, workbook.add_format({'bold': True, 'border': 1}))
+            for row_idx, row in enumerate(rows, 1):
+                worksheet.write_row(row_idx, 0, [_excel_cell(row.get(key)) for key in header])
+            workbook.close()
         
         buffer.seek(0)
         return buffer
     
-    def _export_excel(self, calculation_history: List[Dict], include_charts: bool) -> BytesIO:
-        """Export data as Excel format"""
-        # Convert to CSV data first
-        csv_data = []
+    def _build_rows(self, calculation_history: List[Dict]) -> Tuple[List[str], List[Dict]]:
+        """Build the tabular (one row per calculation) view shared by CSV and Excel
+        
+        Returns the column header, in first-seen order, and the row dicts.
+        """
+        rows = []
+        header = {}
+        
         for calc in calculation_history:
+            method = calc.get('method', '')
+            result = calc.get('result') or {}
             row = {
                 'Timestamp': calc.get('timestamp', ''),
-                'Method': calc.get('method', ''),
+                'Method': method,
                 'Valuation': calc.get('valuation', 0),
-                'Success': calc.get('result', {}).get('success', False)
+                'Success': result.get('success', False)
             }
-            self._add_method_specific_csv_data(row, calc)
-            csv_data.append(row)
-        
-        # Create Excel file in memory
-        buffer = BytesIO()
-        if csv_data:
-            df = pd.DataFrame(csv_data)
-            # Use xlsxwriter engine for better compatibility
-            with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                df.to_excel(writer, sheet_name='Valuations', index=False)
+            
+            # Add method-specific data
+            self._add_method_specific_csv_data(row, method, result, calc.get('inputs') or {})
+            rows.append(row)
+            header.update(dict.fromkeys(row))
         
-        buffer.seek(0)
-        return buffer
+        return list(header), rows
     
-    def _export_json(self, calculation_history: List[Dict], include_charts: bool) -> BytesIO:
-        """Export data as JSON format"""
-        buffer = BytesIO()
-        
+    def _build_export_data(self, calculation_history: List[Dict], include_charts: bool, format_type: str) -> Dict[str, Any]:
+        """Build the nested export document shared by JSON and MessagePack"""
         export_data = {
             'export_metadata': {
-                'timestamp': datetime.now().isoformat(),
-                'format': 'json',
+                'timestamp': datetime.now(),
+                'format': format_type,
                 'version': '1.0',
                 'total_calculations': len(calculation_history),
                 'include_charts': include_charts
@@ -108,13 +351,14 @@ class ExportManager:
         }
         
         for calc in calculation_history:
+            result = calc.get('result') or {}
             calc_data = {
                 'timestamp': calc.get('timestamp', ''),
                 'method': calc.get('method', ''),
                 'valuation': calc.get('valuation', 0),
-                'inputs': calc.get('inputs', {}),
-                'result': calc.get('result', {}),
-                'success': calc.get('result', {}).get('success', False)
+                'inputs': calc.get('inputs') or {},
+                'result': result,
+                'success': result.get('success', False)
             }
             
             # Include chart data if requested and available
@@ -123,157 +367,166 @@ class ExportManager:
             
             export_data['calculations'].append(calc_data)
         
-        json_string = json.dumps(export_data, indent=2, default=str)
-        buffer.write(json_string.encode('utf-8'))
-        buffer.seek(0)
-        return buffer
+        return export_data
+    
+    def _export_json(self, calculation_history: List[Dict], include_charts: bool) -> BytesIO:
+        """Export data as JSON format"""
+        export_data = self._build_export_data(calculation_history, include_charts, 'json')
+        
+        if orjson is not None:
+            payload = orjson.dumps(export_data, default=str, option=_ORJSON_OPTIONS)
+        else:
+            payload = json.dumps(export_data, indent=2, default=_json_default).encode('utf-8')
+        return BytesIO(payload)
+    
+    def _export_msgpack(self, calculation_history: List[Dict], include_charts: bool) -> BytesIO:
+        """Export data as MessagePack binary format"""
+        export_data = self._build_export_data(calculation_history, include_charts, 'msgpack')
+        return BytesIO(msgpack.packb(export_data, use_bin_type=True, default=_msgpack_default))
     
     def _export_xml(self, calculation_history: List[Dict], include_charts: bool) -> BytesIO:
         """Export data as XML format"""
-        buffer = BytesIO()
-        
-        # Create root element
-        root = ET.Element('ValuationExport')
+        # Single join; BytesIO shares the initial bytes instead of growing per write
+        return BytesIO(b''.join(self._iter_export_xml(calculation_history, include_charts)))
+    
+    def _iter_export_xml(self, calculation_history: List[Dict], include_charts: bool) -> Iterator[bytes]:
+        """Yield the XML export as a header, one chunk per calculation and a footer"""
+        parts = []
+        write = parts.append
+        escape_cache = {}
         
-        # Add metadata
-        metadata = ET.SubElement(root, 'Metadata')
-        ET.SubElement(metadata, 'Timestamp').text = datetime.now().isoformat()
-        ET.SubElement(metadata, 'Format').text = 'xml'
-        ET.SubElement(metadata, 'Version').text = '1.0'
-        ET.SubElement(metadata, 'TotalCalculations').text = str(len(calculation_history))
-        ET.SubElement(metadata, 'IncludeCharts').text = str(include_charts)
+        # Metadata
+        write(b'<ValuationExport><Metadata>')
+        _write_xml_text(write, b'Timestamp', datetime.now().isoformat(), escape_cache)
+        write(b'<Format>xml</Format><Version>1.0</Version>')
+        _write_xml_text(write, b'TotalCalculations', len(calculation_history), escape_cache)
+        _write_xml_text(write, b'IncludeCharts', include_charts, escape_cache)
+        write(b'</Metadata>')
         
-        # Add calculations
-        calculations = ET.SubElement(root, 'Calculations')
+        # Calculations
+        if not calculation_history:
+            write(b'<Calculations /></ValuationExport>')
+            yield b''.join(parts)
+            return
         
+        write(b'<Calculations>')
         for calc in calculation_history:
-            calc_elem = ET.SubElement(calculations, 'Calculation')
-            
-            ET.SubElement(calc_elem, 'Timestamp').text = calc.get('timestamp', '')
-            ET.SubElement(calc_elem, 'Method').text = calc.get('method', '')
-            ET.SubElement(calc_elem, 'Valuation').text = str(calc.get('valuation', 0))
-            ET.SubElement(calc_elem, 'Success').text = str(calc.get('result', {}).get('success', False))
-            
-            # Add inputs
-            inputs_elem = ET.SubElement(calc_elem, 'Inputs')
-            self._dict_to_xml(calc.get('inputs', {}), inputs_elem)
-            
-            # Add result details
-            result_elem = ET.SubElement(calc_elem, 'Result')
-            self._dict_to_xml(calc.get('result', {}), result_elem)
+            result = calc.get('result') or {}
+            write(b'<Calculation>')
+            # ElementTree wrote a None timestamp or method as an empty element
+            _write_xml_text(write, b'Timestamp', calc.get('timestamp') or '', escape_cache)
+            _write_xml_text(write, b'Method', calc.get('method') or '', escape_cache)
+            _write_xml_text(write, b'Valuation', calc.get('valuation', 0), escape_cache)
+            _write_xml_text(write, b'Success', result.get('success', False), escape_cache)
+            self._dict_to_xml(b'Inputs', calc.get('inputs') or {}, write, escape_cache)
+            self._dict_to_xml(b'Result', result, write, escape_cache)
+            write(b'</Calculation>')
+            yield b''.join(parts)
+            parts.clear()
         
-        # Convert to string and write to buffer
-        xml_string = ET.tostring(root, encoding='unicode')
-        buffer.write(xml_string.encode('utf-8'))
-        buffer.seek(0)
-        return buffer
+        yield b'</Calculations></ValuationExport>'
     
     def _export_txt(self, calculation_history: List[Dict], include_charts: bool) -> BytesIO:
         """Export data as plain text format"""
-        buffer = BytesIO()
-        
+        return BytesIO(b''.join(self._iter_export_txt(calculation_history, include_charts)))
+    
+    def _iter_export_txt(self, calculation_history: List[Dict], include_charts: bool) -> Iterator[bytes]:
+        """Yield the text report as a header, one chunk per calculation and the summary"""
         lines = []
         lines.append("STARTUP VALUATION CALCULATOR - EXPORT REPORT")
         lines.append("=" * 60)
         lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append(f"Total Calculations: {len(calculation_history)}")
         lines.append("")
+        yield ("\n".join(lines) + "\n").encode('utf-8')
         
+        successful_valuations = []
         for i, calc in enumerate(calculation_history, 1):
+            result = calc.get('result') or {}
+            valuation = calc.get('valuation', 0)
+            success = result.get('success', False)
+            if success:
+                successful_valuations.append(valuation)
+            
+            lines = []
             lines.append(f"CALCULATION #{i}")
             lines.append("-" * 30)
             lines.append(f"Timestamp: {calc.get('timestamp', 'N/A')}")
             lines.append(f"Method: {calc.get('method', 'N/A')}")
-            lines.append(f"Valuation: ${calc.get('valuation', 0):,.2f}")
-            lines.append(f"Success: {calc.get('result', {}).get('success', False)}")
+            lines.append(f"Valuation: ${valuation:,.2f}")
+            lines.append(f"Success: {success}")
             
             # Add method-specific details
-            self._add_method_specific_txt_data(lines, calc)
+            self._add_method_specific_txt_data(lines, result, calc.get('inputs') or {})
             lines.append("")
+            yield ("\n".join(lines) + "\n").encode('utf-8')
         
         # Add summary statistics
+        lines = []
         lines.append("SUMMARY STATISTICS")
         lines.append("-" * 30)
-        valuations = [calc.get('valuation', 0) for calc in calculation_history if calc.get('result', {}).get('success', False)]
-        if valuations:
-            lines.append(f"Average Valuation: ${sum(valuations) / len(valuations):,.2f}")
-            lines.append(f"Median Valuation: ${sorted(valuations)[len(valuations)//2]:,.2f}")
-            lines.append(f"Min Valuation: ${min(valuations):,.2f}")
-            lines.append(f"Max Valuation: ${max(valuations):,.2f}")
+        valuations = np.fromiter(successful_valuations, dtype=np.float64, count=len(successful_valuations))
+        if valuations.size:
+            # Upper median via O(N) partition instead of a full sort
+            mid = valuations.size // 2
+            median = np.partition(valuations, mid)[mid]
+            lines.append(f"Average Valuation: ${valuations.mean():,.2f}")
+            lines.append(f"Median Valuation: ${median:,.2f}")
+            lines.append(f"Min Valuation: ${valuations.min():,.2f}")
+            lines.append(f"Max Valuation: ${valuations.max():,.2f}")
         
-        text_content = "\n".join(lines)
-        buffer.write(text_content.encode('utf-8'))
-        buffer.seek(0)
-        return buffer
+        yield "\n".join(lines).encode('utf-8')
     
-    def _add_method_specific_csv_data(self, row: Dict, calc: Dict):
+    def _add_method_specific_csv_data(self, row: Dict, method: str, result: Dict, inputs: Dict):
         """Add method-specific data to CSV row"""
-        method = calc.get('method', '')
-        result = calc.get('result', {})
-        inputs = calc.get('inputs', {})
-        
-        if method == 'DCF':
-            row['Operating_Value'] = result.get('operating_value', 0)
-            row['Terminal_Value'] = result.get('terminal_pv', 0)
-            row['Discount_Rate'] = inputs.get('discount_rate', 0)
-            row['Terminal_Growth'] = inputs.get('terminal_growth', 0)
-        elif method == 'Market Multiples':
-            row['Sector'] = inputs.get('sector', '')
-            row['Metric_Type'] = inputs.get('metric_type', '')
-            row['Metric_Value'] = inputs.get('metric_value', 0)
-            row['Multiple'] = inputs.get('multiple', 0)
-        elif method == 'Scorecard':
-            row['Base_Valuation'] = inputs.get('base_valuation', 0)
-            row['Adjustment_Factor'] = result.get('adjustment_factor', 1.0)
-        elif method == 'Berkus':
-            breakdown = result.get('breakdown', {})
-            for criteria, details in breakdown.items():
-                row[f'Berkus_{criteria}'] = details.get('value', 0)
-        elif method == 'Risk Factor Summation':
-            row['Base_Valuation'] = inputs.get('base_valuation', 0)
-            row['Total_Adjustment'] = result.get('total_adjustment', 0)
-        elif method == 'Venture Capital':
-            row['Exit_Value'] = result.get('exit_value', 0)
-            row['Present_Value'] = result.get('present_value', 0)
-            row['Required_Return'] = inputs.get('required_return', 0)
-            row['Years_to_Exit'] = inputs.get('years_to_exit', 0)
+        handler = _CSV_HANDLERS.get(method)
+        if handler is not None:
+            handler(row, result, inputs)
     
-    def _dict_to_xml(self, data: Dict, parent: ET.Element):
-        """Convert dictionary to XML elements"""
-        for key, value in data.items():
-            element = ET.SubElement(parent, str(key).replace(' ', '_'))
-            if isinstance(value, dict):
-                self._dict_to_xml(value, element)
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    item_elem = ET.SubElement(element, f'Item_{i}')
-                    if isinstance(item, dict):
-                        self._dict_to_xml(item, item_elem)
+    def _dict_to_xml(self, tag: bytes, data: Dict, write, escape_cache: Dict[str, bytes]):
+        """Write a dictionary as an XML element"""
+        if not data:
+            write(b'<' + tag + b' />')
+            return
+        
+        # Explicit stack of open elements instead of recursion; each frame holds
+        # the closing tag, an iterator over (child tag, value), and whether the
+        # frame is a list (list items only nest further when they are dicts)
+        write(b'<' + tag + b'>')
+        stack = [(tag, _xml_dict_children(data), False)]
+        while stack:
+            close_tag, children, is_list = stack[-1]
+            for child, value in children:
+                if isinstance(value, dict) or (isinstance(value, list) and not is_list):
+                    if not value:
+                        write(b'<' + child + b' />')
+                        continue
+                    write(b'<' + child + b'>')
+                    if isinstance(value, dict):
+                        stack.append((child, _xml_dict_children(value), False))
                     else:
-                        item_elem.text = str(item)
+                        stack.append((child, _xml_list_children(value), True))
+                    break
+                _write_xml_text(write, child, value, escape_cache)
             else:
-                element.text = str(value)
+                stack.pop()
+                write(b'</' + close_tag + b'>')
     
-    def _add_method_specific_txt_data(self, lines: List[str], calc: Dict):
+    def _add_method_specific_txt_data(self, lines: List[str], result: Dict, inputs: Dict):
         """Add method-specific details to text export"""
-        method = calc.get('method', '')
-        result = calc.get('result', {})
-        inputs = calc.get('inputs', {})
-        
         lines.append("\nInputs:")
         for key, value in inputs.items():
             lines.append(f"  {key}: {value}")
         
         lines.append("\nResults:")
         for key, value in result.items():
-            if key not in ['success', 'method']:
-                if isinstance(value, (int, float)):
-                    if 'value' in key.lower() or 'valuation' in key.lower():
-                        lines.append(f"  {key}: ${value:,.2f}")
-                    else:
-                        lines.append(f"  {key}: {value}")
-                else:
-                    lines.append(f"  {key}: {value}")
+            if key in _TXT_SKIPPED_RESULT_KEYS:
+                continue
+            # Only numeric values reach the key check, so non-str keys never hit key.lower()
+            if isinstance(value, (int, float)) and _is_currency_key(key):
+                lines.append(f"  {key}: ${value:,.2f}")
+            else:
+                lines.append(f"  {key}: {value}")
     
     def export_single_calculation(
         self, 
@@ -294,8 +547,21 @@ class ExportManager:
     
     def get_export_metadata(self, calculation_history: List[Dict]) -> Dict[str, Any]:
         """Get metadata about exportable data"""
-        methods = set(calc.get('method', '') for calc in calculation_history)
-        successful_calcs = sum(1 for calc in calculation_history if calc.get('result', {}).get('success', False))
+        methods = set()
+        successful_calcs = 0
+        earliest = latest = None
+        
+        for calc in calculation_history:
+            methods.add(calc.get('method', ''))
+            if (calc.get('result') or {}).get('success', False):
+                successful_calcs += 1
+            timestamp = calc.get('timestamp', '')
+            if earliest is None:
+                earliest = latest = timestamp
+            elif timestamp < earliest:
+                earliest = timestamp
+            elif timestamp > latest:
+                latest = timestamp
         
         return {
             'total_calculations': len(calculation_history),
@@ -303,8 +569,8 @@ class ExportManager:
             'failed_calculations': len(calculation_history) - successful_calcs,
             'methods_used': list(methods),
             'date_range': {
-                'earliest': min(calc.get('timestamp', '') for calc in calculation_history) if calculation_history else '',
-                'latest': max(calc.get('timestamp', '') for calc in calculation_history) if calculation_history else ''
+                'earliest': earliest if earliest is not None else '',
+                'latest': latest if latest is not None else ''
             },
             'supported_formats': self.supported_formats
         }
\ No newline at end of file
@@ -4,45 +4,260 @@ Creates comprehensive PDF reports for valuation calculations
 """
 
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, TableStyle, PageBreak, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab import rl_config
 from reportlab.graphics.shapes import Drawing, Circle, Rect, String, Line, Polygon
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.legends import Legend
 from datetime import datetime
 from io import BytesIO
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, IO, Tuple
 import json
 import math
-import matplotlib.ticker as ticker
-from pdf_chart_generator import PDFChartGenerator
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import islice
+
+# ASCII85 only makes the already deflated streams 25% larger. rl_config is
+# process-wide, so this is set once at import rather than around each build.
+rl_config.useA85 = 0
+
+
+def _header_table_style(header_font_size: int, align: str = 'LEFT',
+                        center_values: bool = False, total_rows: int = 0) -> TableStyle:
+    """Light blue header / beige body table style, with optional grey total rows"""
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), align)
+    ]
+    if center_values:
+        commands.append(('ALIGN', (1, 0), (-1, -1), 'CENTER'))
+    commands += [
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12)
+    ]
+    if total_rows:
+        commands += [
+            ('BACKGROUND', (0, 1), (-1, -total_rows - 1), colors.beige),
+            ('BACKGROUND', (0, -total_rows), (-1, -1), colors.lightgrey),
+            ('FONTNAME', (0, -total_rows), (-1, -1), 'Helvetica-Bold')
+        ]
+    else:
+        commands.append(('BACKGROUND', (0, 1), (-1, -1), colors.beige))
+    commands.append(('GRID', (0, 0), (-1, -1), 1, colors.black))
+    return TableStyle(commands)
+
+
+def _data_table_style(align: str = 'CENTER', wrap: bool = False) -> TableStyle:
+    """Light grey header / white body style used by the chart data tables"""
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('ALIGN', (0, 0), (-1, -1), align),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
+    ]
+    if wrap:
+        commands.append(('WORDWRAP', (0, 0), (-1, -1), True))
+    return TableStyle(commands)
+
+
+def _component_percentages(operating_value: float, terminal_value: float,
+                           total_value: float) -> Tuple[float, float]:
+    """Operating and terminal value as percentages of total_value, or zeros without a positive total"""
+    if total_value > 0:
+        return operating_value / total_value * 100, terminal_value / total_value * 100
+    return 0, 0
+
+
+def _achievement_rate(valuation: float, max_possible: float) -> float:
+    """Berkus valuation as a percentage of the maximum possible valuation"""
+    return (valuation / max_possible * 100) if max_possible > 0 else 0
+
+
+@lru_cache(maxsize=2048)
+def _format_currency(amount: float) -> str:
+    """Format a euro amount; the same totals repeat across report tables"""
+    if amount >= 1000000:
+        return f"€{amount/1000000:.1f}M"
+    elif amount >= 1000:
+        return f"€{amount/1000:.0f}K"
+    else:
+        return f"€{amount:,.0f}"
+
+
+def _last_items(items, count: int) -> List:
+    """Last count items of a list, tuple or deque, without walking the older entries"""
+    if isinstance(items, (list, tuple)):
+        return items[-count:]
+    return list(islice(reversed(items), count))[::-1]
+
+
+# Table styles shared by every report; TableStyle is only read when applied
+_KEY_FINDINGS_STYLE = _header_table_style(12)
+_DETAIL_TABLE_STYLE = _header_table_style(11)
+_DCF_COMPONENTS_STYLE = _header_table_style(11, 'CENTER', total_rows=1)
+_SCORECARD_TABLE_STYLE = _header_table_style(10, 'CENTER')
+_RATED_TABLE_STYLE = _header_table_style(10, center_values=True)
+_HISTORY_TABLE_STYLE = _header_table_style(11, 'CENTER')
+_SUMMARY_TABLE_STYLE = _header_table_style(11, total_rows=3)
+_DATA_TABLE_STYLE = _data_table_style()
+_WRAPPED_DATA_TABLE_STYLE = _data_table_style(wrap=True)
+_LEFT_DATA_TABLE_STYLE = _data_table_style('LEFT')
+
+# Column widths for the same tables
+_KEY_FINDINGS_COLS = (2.5*inch, 3*inch)
+_TWO_COLUMN_COLS = (2.5*inch, 2.5*inch)
+_THREE_COLUMN_COLS = (2*inch, 2*inch, 2*inch)
+_DCF_COMPONENTS_COLS = (2*inch, 2*inch, 1.5*inch)
+_SCORECARD_COLS = (2*inch, 1*inch, 1*inch, 1.5*inch)
+_RATED_COLS = (3*inch, 1*inch, 1.5*inch)
+
+@dataclass(slots=True, frozen=True)
+class _AppendixEntry:
+    """Fields of one history entry, read and formatted once for its appendix page"""
+    method: str
+    result: Dict[str, Any]
+    timestamp: str
+    valuation_text: str
+    chart_data: Dict[str, Any]
+
+
+# Executive summary sentence for the methods that have one, built from the result
+_METHOD_SUMMARIES = {
+    'DCF': lambda result: (
+        f"The DCF analysis shows an operating value of <b>{_format_currency(result.get('operating_value', 0))}</b> "
+        f"and a terminal value of <b>{_format_currency(result.get('terminal_pv', 0))}</b>."
+    ),
+    'Market Multiples': lambda result: (
+        f"The market multiples analysis applies a <b>{result.get('multiple', 0):.1f}x</b> "
+        f"{result.get('metric_type', 'Revenue').lower()} multiple based on industry comparables."
+    ),
+    'Berkus': lambda result: (
+        f"The Berkus method evaluation shows an achievement rate of "
+        f"<b>{_achievement_rate(result.get('valuation', 0), result.get('max_possible', 0)):.1f}%</b> "
+        f"of the maximum possible valuation."
+    )
+}
+
+# Valuation method -> PDFGenerator method adding its detailed analysis
+_ANALYSIS_METHODS = {
+    'DCF': '_add_dcf_analysis',
+    'Market Multiples': '_add_multiples_analysis',
+    'Scorecard': '_add_scorecard_analysis',
+    'Berkus': '_add_berkus_analysis',
+    'Risk Factor Summation': '_add_risk_analysis',
+    'Venture Capital': '_add_vc_analysis'
+}
+
+# Valuation method -> PDFGenerator method adding its chart insights
+_INSIGHT_METHODS = {
+    'DCF': '_add_dcf_insights',
+    'Market Multiples': '_add_multiples_insights',
+    'Scorecard': '_add_scorecard_insights',
+    'Berkus': '_add_berkus_insights',
+    'Risk Factor Summation': '_add_risk_insights',
+    'Venture Capital': '_add_vc_insights'
+}
+
+# Valuation method -> PDFGenerator method adding its chart data table
+_CHART_DATA_METHODS = {
+    'DCF': '_add_dcf_chart_data',
+    'Market Multiples': '_add_multiples_chart_data',
+    'Scorecard': '_add_scorecard_chart_data',
+    'Berkus': '_add_berkus_chart_data',
+    'Risk Factor Summation': '_add_risk_chart_data',
+    'Venture Capital': '_add_vc_chart_data'
+}
+
+# Valuation method -> (PDFGenerator method drawing its ReportLab chart, whether it takes the inputs)
+_REPORTLAB_CHART_METHODS = {
+    'DCF': ('_create_dcf_reportlab_chart', True),
+    'Market Multiples': ('_create_multiples_reportlab_chart', True),
+    'Scorecard': ('_create_scorecard_reportlab_chart', False),
+    'Berkus': ('_create_berkus_reportlab_chart', False),
+    'Risk Factor Summation': ('_create_risk_reportlab_chart', False),
+    'Venture Capital': ('_create_vc_reportlab_chart', True)
+}
+
+# Comparative analysis recommendations, in report order, for the methods used
+_METHOD_RECOMMENDATIONS = (
+    ('DCF', "• DCF Method: Most suitable for companies with predictable cash flows and established business models."),
+    ('Berkus', "• Berkus Method: Ideal for pre-revenue startups, focusing on risk reduction factors."),
+    ('Market Multiples', "• Market Multiples: Provides market-based perspective, best used with comparable companies.")
+)
+
+# Consecutive appendix charts that fail or come back empty, after which the
+# remaining pages skip their charts
+_MAX_CHART_FAILURES = 2
+
+# Methods whose appendix chart PDFGenerator draws itself rather than PDFChartGenerator
+_VISUAL_CHART_METHODS = {
+    'Risk Factor Summation': '_create_risk_factor_visual_chart',
+    'Venture Capital': '_create_vc_method_visual_chart'
+}
+
 
 class PDFGenerator:
     """Generate comprehensive PDF reports for startup valuations"""
     
+    # Sample stylesheet plus the custom styles, built once and shared read-only
+    _shared_styles = None
+    # PDF returned when there is nothing to report, rendered on first use
+    _empty_report_pdf = None
+    
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
-        self.chart_generator = PDFChartGenerator()
+        self.styles = self._get_styles()
+        # Styles used by the section builders, resolved once instead of per paragraph
+        self._normal = self.styles['Normal']
+        self._heading2 = self.styles['Heading2']
+        self._heading3 = self.styles['Heading3']
+        self._heading4 = self.styles['Heading4']
+        self._section_header = self.styles['SectionHeader']
+        self._title = self.styles['Title']
+        self._metric_value = self.styles['MetricValue']
+        # Generation time shown in the report, taken once per report
+        self._generated_at = datetime.now()
     
-    def _create_custom_styles(self):
+    @cached_property
+    def chart_generator(self):
+        """Chart generator, created on first use so reports without charts never load matplotlib"""
+        from pdf_chart_generator import PDFChartGenerator
+        return PDFChartGenerator()
+    
+    @classmethod
+    def _get_styles(cls):
+        """Return the report stylesheet, building it on first use"""
+        if cls._shared_styles is None:
+            styles = getSampleStyleSheet()
+            cls._create_custom_styles(styles)
+            cls._shared_styles = styles
+        return cls._shared_styles
+    
+    @staticmethod
+    def _create_custom_styles(styles):
         """Create custom paragraph styles"""
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Title'],
+            parent=styles['Title'],
             fontSize=24,
             spaceAfter=30,
             textColor=colors.darkblue,
             alignment=TA_CENTER
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=16,
             spaceAfter=12,
             spaceBefore=20,
@@ -52,44 +267,51 @@ class PDFGenerator:
             borderPadding=5
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='MetricValue',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=14,
             textColor=colors.darkgreen,
             alignment=TA_RIGHT,
             fontName='Helvetica-Bold'
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='Warning',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             textColor=colors.red,
             leftIndent=20,
             fontName='Helvetica-Oblique'
         ))
     
-    def create_report(self, current_results: Dict, calculation_history: List[Dict]) -> BytesIO:
+    def create_report(self, current_results: Dict, calculation_history: List[Dict],
+                      out: Optional[IO[bytes]] = None) -> Optional[BytesIO]:
         """
         Create comprehensive PDF report with charts from calculation history
         
         Args:
             current_results: Current calculation results
             calculation_history: List of previous calculations
+            out: Optional binary file-like object to write the PDF to
         
         Returns:
-            BytesIO buffer containing PDF data
+            BytesIO buffer containing PDF data, or None when written to out
         """
+        if not current_results and not calculation_history:
+            return self._create_empty_report(out)
+        
         try:
-            buffer = BytesIO()
+            buffer = BytesIO() if out is None else out
+            self._generated_at = datetime.now()
             doc = SimpleDocTemplate(
                 buffer,
                 pagesize=A4,
                 rightMargin=72,
                 leftMargin=72,
                 topMargin=72,
-                bottomMargin=18
+                bottomMargin=18,
+                pageCompression=1
             )
             
             # Build content
@@ -119,43 +341,55 @@ class PDFGenerator:
             
             # Build PDF
             doc.build(story)
+            if out is not None:
+                return None
             buffer.seek(0)
             
             return buffer
             
         except Exception as e:
             # Return error PDF
-            return self._create_error_pdf(str(e))
+            return self._create_error_pdf(str(e), out)
         finally:
-            # Clean up temporary chart files
-            self.chart_generator.cleanup_temp_files()
+            # Release the chart figures once the report is built; rendered PNGs stay cached
+            if 'chart_generator' in self.__dict__:
+                self.chart_generator.close()
+    
+    def _create_empty_report(self, out: Optional[IO[bytes]] = None) -> Optional[BytesIO]:
+        """Return the cached no-data PDF without building a report"""
+        if PDFGenerator._empty_report_pdf is None:
+            PDFGenerator._empty_report_pdf = self._create_error_pdf("No calculation data provided.").getvalue()
+        if out is not None:
+            out.write(PDFGenerator._empty_report_pdf)
+            return None
+        return BytesIO(PDFGenerator._empty_report_pdf)
     
     def _add_title_page(self, story: List):
         """Add title page to the report"""
-        story.append(Spacer(1, 2*inch))
-        
-        story.append(Paragraph("Startup Valuation Report", self.styles['CustomTitle']))
-        story.append(Spacer(1, 0.5*inch))
-        
-        story.append(Paragraph(
-            f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
-            self.styles['Normal']
-        ))
-        
-        story.append(Spacer(1, 1*inch))
-        
-        # Company placeholder
-        story.append(Paragraph("Company: _________________________", self.styles['Normal']))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph("Prepared by: _____________________", self.styles['Normal']))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph("Date: ____________________________", self.styles['Normal']))
-        
-        story.append(PageBreak())
+        # Built for every report: flowables keep per-build layout state, so
+        # sharing them would race when several sessions build at once
+        story.extend([
+            Spacer(1, 2*inch),
+            Paragraph("Startup Valuation Report", self.styles['CustomTitle']),
+            Spacer(1, 0.5*inch),
+            Paragraph(
+                f"Generated on: {self._generated_at.strftime('%B %d, %Y at %I:%M %p')}",
+                self._normal
+            ),
+            Spacer(1, 1*inch),
+            
+            # Company placeholder
+            Paragraph("Company: _________________________", self._normal),
+            Spacer(1, 0.3*inch),
+            Paragraph("Prepared by: _____________________", self._normal),
+            Spacer(1, 0.3*inch),
+            Paragraph("Date: ____________________________", self._normal),
+            PageBreak()
+        ])
     
     def _add_executive_summary(self, story: List, current_results: Dict):
         """Add executive summary section"""
-        story.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
+        story.append(Paragraph("Executive Summary", self._section_header))
         
         method = current_results.get('method', 'Unknown')
         result = current_results.get('result', {})
@@ -163,7 +397,7 @@ class PDFGenerator:
         
         story.append(Paragraph(
             f"This report presents a startup valuation analysis using the <b>{method}</b> method.",
-            self.styles['Normal']
+            self._normal
         ))
         
         story.append(Spacer(1, 0.2*inch))
@@ -172,142 +406,75 @@ class PDFGenerator:
         key_data = [
             ['Valuation Method', method],
             ['Calculated Valuation', self._format_currency(valuation)],
-            ['Analysis Date', datetime.now().strftime('%B %d, %Y')],
+            ['Analysis Date', self._generated_at.strftime('%B %d, %Y')],
             ['Report Status', 'Final']
         ]
         
-        key_table = Table(key_data, colWidths=[2.5*inch, 3*inch])
-        key_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        key_table = Table(key_data, colWidths=_KEY_FINDINGS_COLS)
+        key_table.setStyle(_KEY_FINDINGS_STYLE)
         
-        story.append(key_table)
-        story.append(Spacer(1, 0.3*inch))
+        story.extend([key_table, Spacer(1, 0.3*inch)])
         
         # Method-specific summary
         self._add_method_summary(story, method, result)
         
     def _add_method_summary(self, story: List, method: str, result: Dict):
         """Add method-specific summary"""
-        if method == "DCF":
-            operating_value = result.get('operating_value', 0)
-            terminal_value = result.get('terminal_pv', 0)
-            
-            story.append(Paragraph(
-                f"The DCF analysis shows an operating value of <b>{self._format_currency(operating_value)}</b> "
-                f"and a terminal value of <b>{self._format_currency(terminal_value)}</b>.",
-                self.styles['Normal']
-            ))
-            
-        elif method == "Market Multiples":
-            multiple = result.get('multiple', 0)
-            metric_type = result.get('metric_type', 'Revenue')
-            
-            story.append(Paragraph(
-                f"The market multiples analysis applies a <b>{multiple:.1f}x</b> {metric_type.lower()} "
-                f"multiple based on industry comparables.",
-                self.styles['Normal']
-            ))
-            
-        elif method == "Berkus":
-            max_possible = result.get('max_possible', 0)
-            achievement_rate = (result.get('valuation', 0) / max_possible * 100) if max_possible > 0 else 0
-            
-            story.append(Paragraph(
-                f"The Berkus method evaluation shows an achievement rate of <b>{achievement_rate:.1f}%</b> "
-                f"of the maximum possible valuation.",
-                self.styles['Normal']
-            ))
+        summary = _METHOD_SUMMARIES.get(method)
+        if summary:
+            story.append(Paragraph(summary(result), self._normal))
     
     def _add_detailed_analysis(self, story: List, current_results: Dict):
         """Add detailed analysis section"""
-        story.append(PageBreak())
-        story.append(Paragraph("Detailed Analysis", self.styles['SectionHeader']))
+        story.extend([PageBreak(), Paragraph("Detailed Analysis", self._section_header)])
         
         method = current_results.get('method', 'Unknown')
         result = current_results.get('result', {})
         
-        if method == "DCF":
-            self._add_dcf_analysis(story, result)
-        elif method == "Market Multiples":
-            self._add_multiples_analysis(story, result, current_results)
-        elif method == "Scorecard":
-            self._add_scorecard_analysis(story, result)
-        elif method == "Berkus":
-            self._add_berkus_analysis(story, result)
-        elif method == "Risk Factor Summation":
-            self._add_risk_analysis(story, result)
-        elif method == "Venture Capital":
-            self._add_vc_analysis(story, result, current_results)
+        handler = _ANALYSIS_METHODS.get(method)
+        if handler:
+            getattr(self, handler)(story, result, current_results)
     
-    def _add_dcf_analysis(self, story: List, result: Dict):
+    def _add_dcf_analysis(self, story: List, result: Dict, calc: Dict):
         """Add DCF-specific analysis with visual chart"""
-        story.append(Paragraph("Valuation Components", self.styles['Heading4']))
+        story.append(Paragraph("Valuation Components", self._heading4))
         
         # Components table
         operating_value = result.get('operating_value', 0)
         terminal_pv = result.get('terminal_pv', 0)
-        total_value = operating_value + terminal_pv
+        valuation = result.get('valuation', 0)
         
-        op_percentage = (operating_value / total_value * 100) if total_value > 0 else 0
-        term_percentage = (terminal_pv / total_value * 100) if total_value > 0 else 0
+        # Percentages of the reported valuation, or of the component sum without one
+        total_value = valuation if valuation > 0 else operating_value + terminal_pv
+        op_percentage, term_percentage = _component_percentages(operating_value, terminal_pv, total_value)
         
         components = [
             ['Component', 'Value', 'Percentage'],
             ['Operating Value', self._format_currency(operating_value), f'{op_percentage:.1f}%'],
             ['Terminal Value (PV)', self._format_currency(terminal_pv), f'{term_percentage:.1f}%'],
-            ['Total Valuation', self._format_currency(result.get('valuation', 0)), '100%']
+            ['Total Valuation', self._format_currency(valuation), '100%']
         ]
         
-        # Calculate percentages
-        total_val = result.get('valuation', 0)
-        if total_val > 0:
-            components[1][2] = f"{(result.get('operating_value', 0) / total_val * 100):.1f}%"
-            components[2][2] = f"{(result.get('terminal_pv', 0) / total_val * 100):.1f}%"
+        comp_table = Table(components, colWidths=_DCF_COMPONENTS_COLS)
+        comp_table.setStyle(_DCF_COMPONENTS_STYLE)
         
-        comp_table = Table(components, colWidths=[2*inch, 2*inch, 1.5*inch])
-        comp_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
-        story.append(comp_table)
-        story.append(Spacer(1, 0.2*inch))
+        story.extend([comp_table, Spacer(1, 0.2*inch)])
         
         # Assumptions
-        story.append(Paragraph("Key Assumptions", self.styles['Heading3']))
-        story.append(Paragraph(
-            f"• Discount Rate: {result.get('discount_rate', 0)*100:.1f}%",
-            self.styles['Normal']
-        ))
+        story.append(Paragraph("Key Assumptions", self._heading3))
         story.append(Paragraph(
+            f"• Discount Rate: {result.get('discount_rate', 0)*100:.1f}%<br/>"
             f"• Terminal Growth Rate: {result.get('terminal_growth', 0)*100:.1f}%",
-            self.styles['Normal']
+            self._normal
         ))
     
-    def _add_multiples_analysis(self, story: List, result: Dict, current_results: Dict):
+    def _add_multiples_analysis(self, story: List, result: Dict, calc: Dict):
         """Add market multiples analysis"""
-        story.append(Paragraph("Analysis Details", self.styles['Heading4']))
+        story.append(Paragraph("Analysis Details", self._heading4))
         
-        sector = current_results.get('sector', 'Unknown')
+        sector = calc.get('sector', 'Unknown')
         
-        story.append(Paragraph(f"Industry Sector: <b>{sector}</b>", self.styles['Normal']))
-        story.append(Spacer(1, 0.1*inch))
+        story.extend([Paragraph(f"Industry Sector: <b>{sector}</b>", self._normal), Spacer(1, 0.1*inch)])
         
         calc_data = [
             ['Metric', 'Value'],
@@ -316,138 +483,78 @@ class PDFGenerator:
             ['Calculated Valuation', self._format_currency(result.get('valuation', 0))]
         ]
         
-        calc_table = Table(calc_data, colWidths=[2.5*inch, 2.5*inch])
-        calc_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        calc_table = Table(calc_data, colWidths=_TWO_COLUMN_COLS)
+        calc_table.setStyle(_DETAIL_TABLE_STYLE)
         
         story.append(calc_table)
     
-    def _add_scorecard_analysis(self, story: List, result: Dict):
+    def _add_scorecard_analysis(self, story: List, result: Dict, calc: Dict):
         """Add scorecard method analysis"""
-        story.append(Paragraph("Criteria Breakdown", self.styles['Heading4']))
+        story.append(Paragraph("Criteria Breakdown", self._heading4))
         
         # Criteria analysis table
-        criteria_data = [['Criterion', 'Score', 'Weight', 'Contribution']]
-        
         criteria_analysis = result.get('criteria_analysis', {})
-        for criterion, data in criteria_analysis.items():
-            criteria_data.append([
-                criterion.title(),
-                f"{data['score']}/5",
-                f"{data['weight']:.1%}",
-                f"{data['contribution']:.3f}"
-            ])
+        criteria_data = [('Criterion', 'Score', 'Weight', 'Contribution')] + [
+            (criterion.title(), f"{data['score']}/5", f"{data['weight']:.1%}", f"{data['contribution']:.3f}")
+            for criterion, data in criteria_analysis.items()
+        ]
         
-        criteria_table = Table(criteria_data, colWidths=[2*inch, 1*inch, 1*inch, 1.5*inch])
-        criteria_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        criteria_table = Table(criteria_data, colWidths=_SCORECARD_COLS)
+        criteria_table.setStyle(_SCORECARD_TABLE_STYLE)
         
-        story.append(criteria_table)
-        story.append(Spacer(1, 0.2*inch))
+        story.extend([criteria_table, Spacer(1, 0.2*inch)])
         
         # Summary
         story.append(Paragraph(
-            f"Base Valuation: <b>{self._format_currency(result.get('base_valuation', 0))}</b>",
-            self.styles['Normal']
-        ))
-        story.append(Paragraph(
-            f"Adjustment Factor: <b>{result.get('adjustment_factor', 0):.2f}x</b>",
-            self.styles['Normal']
-        ))
-        story.append(Paragraph(
+            f"Base Valuation: <b>{self._format_currency(result.get('base_valuation', 0))}</b><br/>"
+            f"Adjustment Factor: <b>{result.get('adjustment_factor', 0):.2f}x</b><br/>"
             f"Adjusted Valuation: <b>{self._format_currency(result.get('valuation', 0))}</b>",
-            self.styles['Normal']
+            self._normal
         ))
     
-    def _add_berkus_analysis(self, story: List, result: Dict):
+    def _add_berkus_analysis(self, story: List, result: Dict, calc: Dict):
         """Add Berkus method analysis"""
-        story.append(Paragraph("Value Breakdown", self.styles['Heading4']))
+        story.append(Paragraph("Value Breakdown", self._heading4))
         
         # Breakdown table
-        breakdown_data = [['Criterion', 'Score', 'Value Assigned']]
-        
         breakdown = result.get('breakdown', {})
-        for criterion, data in breakdown.items():
-            breakdown_data.append([
-                data['name'],
-                f"{data['score']}/5",
-                self._format_currency(data['value'])
-            ])
+        breakdown_data = [('Criterion', 'Score', 'Value Assigned')] + [
+            (data['name'], f"{data['score']}/5", self._format_currency(data['value']))
+            for data in breakdown.values()
+        ]
         
-        breakdown_table = Table(breakdown_data, colWidths=[3*inch, 1*inch, 1.5*inch])
-        breakdown_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        breakdown_table = Table(breakdown_data, colWidths=_RATED_COLS)
+        breakdown_table.setStyle(_RATED_TABLE_STYLE)
         
-        story.append(breakdown_table)
-        story.append(Spacer(1, 0.2*inch))
+        story.extend([breakdown_table, Spacer(1, 0.2*inch)])
     
-    def _add_risk_analysis(self, story: List, result: Dict):
+    def _add_risk_analysis(self, story: List, result: Dict, calc: Dict):
         """Add risk factor analysis"""
-        story.append(Paragraph("Risk Assessment", self.styles['Heading4']))
+        story.append(Paragraph("Risk Assessment", self._heading4))
         
         # Risk factors table
-        risk_data = [['Risk Factor', 'Rating', 'Adjustment']]
-        
         risk_analysis = result.get('risk_analysis', {})
-        for factor, data in risk_analysis.items():
-            risk_data.append([
-                data['name'],
-                f"{data['rating']:+d}",
-                f"{data['adjustment']:+.1%}"
-            ])
+        risk_data = [('Risk Factor', 'Rating', 'Adjustment')] + [
+            (data['name'], f"{data['rating']:+d}", f"{data['adjustment']:+.1%}")
+            for data in risk_analysis.values()
+        ]
         
-        risk_table = Table(risk_data, colWidths=[3*inch, 1*inch, 1.5*inch])
-        risk_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        risk_table = Table(risk_data, colWidths=_RATED_COLS)
+        risk_table.setStyle(_RATED_TABLE_STYLE)
         
-        story.append(risk_table)
-        story.append(Spacer(1, 0.2*inch))
+        story.extend([risk_table, Spacer(1, 0.2*inch)])
         
         # Summary
         story.append(Paragraph(
             f"Total Risk Adjustment: <b>{result.get('total_adjustment', 0):+.1%}</b>",
-            self.styles['Normal']
+            self._normal
         ))
     
-    def _add_vc_analysis(self, story: List, result: Dict, current_results: Dict):
+    def _add_vc_analysis(self, story: List, result: Dict, calc: Dict):
         """Add VC method analysis"""
-        story.append(Paragraph("Investment Structure", self.styles['Heading4']))
+        story.append(Paragraph("Investment Structure", self._heading4))
         
-        include_investment = current_results.get('include_investment', False)
+        include_investment = calc.get('include_investment', False)
         
         if include_investment and 'pre_money_valuation' in result:
             # Investment structure
@@ -468,195 +575,215 @@ class PDFGenerator:
                 ['Annualized Return', f"{result.get('annualized_return', 0):.1%}"]
             ]
         
-        invest_table = Table(invest_data, colWidths=[2.5*inch, 2.5*inch])
-        invest_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        invest_table = Table(invest_data, colWidths=_TWO_COLUMN_COLS)
+        invest_table.setStyle(_DETAIL_TABLE_STYLE)
         
         story.append(invest_table)
     
     def _add_calculation_history(self, story: List, calculation_history: List[Dict]):
         """Add calculation history section"""
-        story.append(PageBreak())
-        story.append(Paragraph("Calculation History", self.styles['SectionHeader']))
+        story.extend([PageBreak(), Paragraph("Calculation History", self._section_header)])
         
         if not calculation_history:
-            story.append(Paragraph("No previous calculations available.", self.styles['Normal']))
+            story.append(Paragraph("No previous calculations available.", self._normal))
             return
         
-        # History table
-        history_data = [['Date', 'Method', 'Valuation']]
-        
-        for calc in calculation_history[-10:]:  # Last 10 calculations
-            history_data.append([
-                calc.get('timestamp', 'Unknown'),
-                calc.get('method', 'Unknown'),
-                self._format_currency(calc.get('valuation', 0))
-            ])
+        # History table of the last 10 calculations
+        history_data = [('Date', 'Method', 'Valuation')] + [
+            (calc.get('timestamp', 'Unknown'), calc.get('method', 'Unknown'),
+             self._format_currency(calc.get('valuation', 0)))
+            for calc in _last_items(calculation_history, 10)
+        ]
         
-        history_table = Table(history_data, colWidths=[2*inch, 2*inch, 2*inch])
-        history_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        history_table = LongTable(history_data, colWidths=_THREE_COLUMN_COLS, repeatRows=1)
+        history_table.setStyle(_HISTORY_TABLE_STYLE)
         
         story.append(history_table)
     
     def _add_charts_appendix(self, story: List, calculation_history: List[Dict]):
         """Add charts appendix with each valuation method on its own page"""
-        story.append(PageBreak())
-        story.append(Paragraph("Appendix A: Visual Charts", self.styles['SectionHeader']))
-        story.append(Paragraph(
-            "This appendix contains the visual charts for each valuation method, "
-            "presented in the order they were calculated.",
-            self.styles['Normal']
-        ))
-        story.append(Spacer(1, 0.3*inch))
-        
-        for i, calc in enumerate(calculation_history):
+        story.extend([
+            PageBreak(),
+            Paragraph("Appendix A: Visual Charts", self._section_header),
+            Paragraph(
+                "This appendix contains the visual charts for each valuation method, "
+                "presented in the order they were calculated.",
+                self._normal
+            ),
+            Spacer(1, 0.3*inch)
+        ])
+        
+        entries = [self._appendix_entry(calc) for calc in calculation_history]
+        
+        # Render the matplotlib charts for every calculation in parallel up front;
+        # the story itself is still built in order below
+        chart_futures = self.chart_generator.render_each([entry.chart_data for entry in entries])
+        # PNGs of the charts drawn here, so repeated identical calculations draw once
+        visual_charts = {}
+        consecutive_failures = 0
+        
+        for i, entry in enumerate(entries):
             # Page break before each method (except the first one)
             if i > 0:
                 story.append(PageBreak())
             
-            method = calc.get('method', 'Unknown')
-            result = calc.get('result', {})
-            timestamp = calc.get('timestamp', 'Unknown')
-            valuation = result.get('valuation', 0)
-            
-            # Method header with key information
-            story.append(Paragraph(f"{method} Method", self.styles['Heading2']))
-            story.append(Spacer(1, 0.2*inch))
+            story.extend([
+                # Method header with key information
+                Paragraph(f"{entry.method} Method", self._heading2),
+                Spacer(1, 0.2*inch),
+                
+                # Summary information
+                Paragraph(f"Date: {entry.timestamp}", self._normal),
+                Paragraph(f"Valuation: {entry.valuation_text}", self._normal),
+                Spacer(1, 0.3*inch)
+            ])
             
-            # Summary information
-            story.append(Paragraph(f"Date: {timestamp}", self.styles['Normal']))
-            story.append(Paragraph(f"Valuation: {self._format_currency(valuation)}", self.styles['Normal']))
-            story.append(Spacer(1, 0.3*inch))
+            # Charts keep failing, so this environment cannot draw them; text only
+            if consecutive_failures >= _MAX_CHART_FAILURES:
+                story.append(Paragraph(
+                    f"Chart visualization not available for {entry.method} method.",
+                    self._normal
+                ))
+                continue
             
             # Generate and add chart
             try:
-                chart_data = {
-                    'result': result,
-                    'inputs': calc.get('inputs', {}),
-                    'method': method
-                }
+                chart_future = chart_futures[i]
                 
-                chart_path = None
-                if method == "DCF":
-                    chart_path = self.chart_generator.create_dcf_chart(chart_data)
-                elif method == "Market Multiples":
-                    chart_path = self.chart_generator.create_multiples_chart(chart_data)
-                elif method == "Scorecard":
-                    chart_path = self.chart_generator.create_scorecard_chart(chart_data)
-                elif method == "Berkus":
-                    chart_path = self.chart_generator.create_berkus_chart(chart_data)
-                elif method == "Risk Factor Summation":
-                    chart_path = self._create_risk_factor_visual_chart(result)
-                elif method == "Venture Capital":
-                    chart_path = self._create_vc_method_visual_chart(result)
+                chart_png = None
+                if chart_future is not None:
+                    chart_png = chart_future.result()
+                elif entry.method in _VISUAL_CHART_METHODS:
+                    key = (entry.method, json.dumps(entry.result, sort_keys=True, default=str))
+                    if key not in visual_charts:
+                        chart = getattr(self, _VISUAL_CHART_METHODS[entry.method])(entry.result)
+                        visual_charts[key] = chart.getvalue() if chart is not None else None
+                    chart_png = visual_charts[key]
+                else:
+                    # No chart for this method; neither a success nor a failure
+                    story.append(Paragraph(
+                        f"Chart visualization not available for {entry.method} method.",
+                        self._normal
+                    ))
+                    continue
                 
-                if chart_path:
+                if chart_png:
                     # Add chart with larger size for single-page display
                     chart_image = self.chart_generator.create_reportlab_image(
-                        chart_path, width=6.5*inch, height=4.5*inch
+                        chart_png, width=6.5*inch, height=4.5*inch
                     )
-                    story.append(chart_image)
-                    story.append(Spacer(1, 0.3*inch))
+                    story.extend([chart_image, Spacer(1, 0.3*inch)])
                     
                     # Add key insights or interpretation
-                    self._add_chart_interpretation(story, method, result)
+                    self._add_chart_interpretation(story, entry)
+                    consecutive_failures = 0
                 else:
+                    # The chart helpers swallow their own errors and return None
+                    consecutive_failures += 1
                     story.append(Paragraph(
-                        f"Chart visualization not available for {method} method.",
-                        self.styles['Normal']
+                        f"Chart visualization not available for {entry.method} method.",
+                        self._normal
                     ))
                     
             except Exception as e:
+                consecutive_failures += 1
                 story.append(Paragraph(
-                    f"Error generating chart for {method} method.",
-                    self.styles['Normal']
+                    f"Error generating chart for {entry.method} method.",
+                    self._normal
                 ))
+            
+            if consecutive_failures >= _MAX_CHART_FAILURES:
+                # Drop the renders still queued for the remaining pages
+                for future in chart_futures[i + 1:]:
+                    if future is not None:
+                        future.cancel()
+    
+    def _appendix_entry(self, calc: Dict) -> _AppendixEntry:
+        """Read the fields an appendix page needs from one history entry"""
+        method = calc.get('method', 'Unknown')
+        result = calc.get('result', {})
+        return _AppendixEntry(
+            method=method,
+            result=result,
+            timestamp=calc.get('timestamp', 'Unknown'),
+            valuation_text=self._format_currency(result.get('valuation', 0)),
+            chart_data={'result': result, 'inputs': calc.get('inputs', {}), 'method': method}
+        )
     
-    def _add_chart_interpretation(self, story: List, method: str, result: Dict):
+    def _add_chart_interpretation(self, story: List, entry: _AppendixEntry):
         """Add interpretation and key insights for each chart"""
-        story.append(Paragraph("Key Insights:", self.styles['Heading3']))
+        story.append(Paragraph("Key Insights:", self._heading3))
         
-        if method == "DCF":
-            operating_value = result.get('operating_value', 0)
-            terminal_pv = result.get('terminal_pv', 0)
-            total_value = operating_value + terminal_pv
-            
-            if total_value > 0:
-                op_percentage = (operating_value / total_value * 100)
-                term_percentage = (terminal_pv / total_value * 100)
-                
-                story.append(Paragraph(
-                    f"• Operating cash flows contribute {op_percentage:.1f}% of total valuation",
-                    self.styles['Normal']
-                ))
-                story.append(Paragraph(
-                    f"• Terminal value represents {term_percentage:.1f}% of total valuation",
-                    self.styles['Normal']
-                ))
-                
-        elif method == "Market Multiples":
-            multiple = result.get('multiple', 0)
-            metric_type = result.get('metric_type', 'Revenue')
-            story.append(Paragraph(
-                f"• Applied {multiple:.1f}x {metric_type.lower()} multiple based on industry comparables",
-                self.styles['Normal']
-            ))
-            
-        elif method == "Scorecard":
-            adjustment_factor = result.get('adjustment_factor', 0)
-            story.append(Paragraph(
-                f"• Overall adjustment factor: {adjustment_factor:.2f}x relative to base valuation",
-                self.styles['Normal']
-            ))
-            
-        elif method == "Berkus":
-            max_possible = result.get('max_possible', 0)
-            achievement_rate = (result.get('valuation', 0) / max_possible * 100) if max_possible > 0 else 0
-            story.append(Paragraph(
-                f"• Achievement rate: {achievement_rate:.1f}% of maximum possible valuation",
-                self.styles['Normal']
-            ))
-            
-        elif method == "Risk Factor Summation":
-            total_adjustment = result.get('total_adjustment', 0)
-            story.append(Paragraph(
-                f"• Net risk adjustment: {total_adjustment:+.1%} applied to base valuation",
-                self.styles['Normal']
-            ))
+        handler = _INSIGHT_METHODS.get(entry.method)
+        if handler:
+            getattr(self, handler)(story, entry.result)
+        
+        story.append(Spacer(1, 0.2*inch))
+    
+    def _add_dcf_insights(self, story: List, result: Dict):
+        """Add DCF chart insights"""
+        operating_value = result.get('operating_value', 0)
+        terminal_pv = result.get('terminal_pv', 0)
+        total_value = operating_value + terminal_pv
+        
+        if total_value > 0:
+            op_percentage, term_percentage = _component_percentages(operating_value, terminal_pv, total_value)
             
-        elif method == "Venture Capital":
-            return_multiple = result.get('return_multiple', 0)
             story.append(Paragraph(
-                f"• Required return multiple: {return_multiple:.1f}x over investment period",
-                self.styles['Normal']
+                f"• Operating cash flows contribute {op_percentage:.1f}% of total valuation<br/>"
+                f"• Terminal value represents {term_percentage:.1f}% of total valuation",
+                self._normal
             ))
-        
-        story.append(Spacer(1, 0.2*inch))
     
-    def _create_risk_factor_visual_chart(self, result: Dict) -> Optional[str]:
+    def _add_multiples_insights(self, story: List, result: Dict):
+        """Add market multiples chart insights"""
+        multiple = result.get('multiple', 0)
+        metric_type = result.get('metric_type', 'Revenue')
+        story.append(Paragraph(
+            f"• Applied {multiple:.1f}x {metric_type.lower()} multiple based on industry comparables",
+            self._normal
+        ))
+    
+    def _add_scorecard_insights(self, story: List, result: Dict):
+        """Add scorecard chart insights"""
+        adjustment_factor = result.get('adjustment_factor', 0)
+        story.append(Paragraph(
+            f"• Overall adjustment factor: {adjustment_factor:.2f}x relative to base valuation",
+            self._normal
+        ))
+    
+    def _add_berkus_insights(self, story: List, result: Dict):
+        """Add Berkus chart insights"""
+        valuation = result.get('valuation', 0)
+        max_possible = result.get('max_possible', 0)
+        achievement_rate = _achievement_rate(valuation, max_possible)
+        story.append(Paragraph(
+            f"• Achievement rate: {achievement_rate:.1f}% of maximum possible valuation",
+            self._normal
+        ))
+    
+    def _add_risk_insights(self, story: List, result: Dict):
+        """Add risk factor chart insights"""
+        total_adjustment = result.get('total_adjustment', 0)
+        story.append(Paragraph(
+            f"• Net risk adjustment: {total_adjustment:+.1%} applied to base valuation",
+            self._normal
+        ))
+    
+    def _add_vc_insights(self, story: List, result: Dict):
+        """Add VC method chart insights"""
+        return_multiple = result.get('return_multiple', 0)
+        story.append(Paragraph(
+            f"• Required return multiple: {return_multiple:.1f}x over investment period",
+            self._normal
+        ))
+    
+    def _create_risk_factor_visual_chart(self, result: Dict) -> Optional[BytesIO]:
         """Create a simple risk factor visualization"""
         try:
-            import matplotlib.pyplot as plt
+            import numpy as np
             
-            fig, ax = plt.subplots(figsize=(8, 5))
-            fig.patch.set_facecolor('white')
+            fig, ax = self.chart_generator.single_axes((8, 5))
             
             risk_analysis = result.get('risk_analysis', {})
             if not risk_analysis:
@@ -667,36 +794,30 @@ class PDFGenerator:
                 ax.axis('off')
             else:
                 factors = list(risk_analysis.keys())
-                adjustments = [data.get('adjustment', 0) * 100 for data in risk_analysis.values()]
+                adjustments = np.fromiter(
+                    (data.get('adjustment', 0) for data in risk_analysis.values()),
+                    dtype=np.float64, count=len(risk_analysis)
+                ) * 100
                 
-                bars = ax.barh(factors, adjustments)
+                # Color bars based on positive/negative, face and edge alike
+                bar_colors = np.select([adjustments > 0, adjustments < 0], ['red', 'green'], 'gray').tolist()
+                ax.barh(factors, adjustments, color=bar_colors, edgecolor=bar_colors)
                 ax.set_xlabel('Risk Adjustment (%)')
                 ax.set_title('Risk Factor Analysis')
                 ax.grid(True, alpha=0.3)
-                
-                # Color bars based on positive/negative
-                for bar, adj in zip(bars, adjustments):
-                    if adj > 0:
-                        bar.set_color('red')
-                    elif adj < 0:
-                        bar.set_color('green')
-                    else:
-                        bar.set_color('gray')
             
-            plt.tight_layout()
-            return self.chart_generator._save_chart_to_temp(fig)
+            fig.tight_layout()
+            return self.chart_generator._save_chart_to_buffer(fig)
             
         except Exception:
             return None
     
-    def _create_vc_method_visual_chart(self, result: Dict) -> Optional[str]:
+    def _create_vc_method_visual_chart(self, result: Dict) -> Optional[BytesIO]:
         """Create a simple VC method visualization"""
         try:
-            import matplotlib.pyplot as plt
             import matplotlib.ticker as ticker
             
-            fig, ax = plt.subplots(figsize=(8, 5))
-            fig.patch.set_facecolor('white')
+            fig, ax = self.chart_generator.single_axes((8, 5))
             
             exit_value = result.get('exit_value', 0)
             present_value = result.get('present_value', 0)
@@ -725,77 +846,78 @@ class PDFGenerator:
                 ax.set_ylim(0, 1)
                 ax.axis('off')
             
-            plt.tight_layout()
-            return self.chart_generator._save_chart_to_temp(fig)
+            fig.tight_layout()
+            return self.chart_generator._save_chart_to_buffer(fig)
             
         except Exception:
             return None
 
     def _add_appendices(self, story: List):
         """Add appendices section"""
-        story.append(PageBreak())
-        story.append(Paragraph("Appendices", self.styles['SectionHeader']))
-        
-        # Disclaimer
-        story.append(Paragraph("Important Disclaimers", self.styles['Heading3']))
-        story.append(Paragraph(
-            "This valuation report is for informational purposes only and should not be considered "
-            "as investment advice. The calculations are based on assumptions and inputs provided "
-            "and may not reflect actual market conditions or future performance.",
-            self.styles['Warning']
-        ))
-        
-        story.append(Spacer(1, 0.3*inch))
-        
-        # Methodology notes
-        story.append(Paragraph("Methodology Notes", self.styles['Heading3']))
-        story.append(Paragraph(
-            "• DCF valuations are sensitive to discount rate and growth assumptions\n"
-            "• Market multiples depend on the availability of comparable companies\n"
-            "• Scorecard and Berkus methods involve subjective scoring\n"
-            "• Risk assessments should be regularly updated\n"
-            "• VC method assumes specific exit scenarios",
-            self.styles['Normal']
-        ))
+        # Built for every report, like the title page, so concurrent builds never share flowables
+        story.extend([
+            PageBreak(),
+            Paragraph("Appendices", self._section_header),
+            
+            # Disclaimer
+            Paragraph("Important Disclaimers", self._heading3),
+            Paragraph(
+                "This valuation report is for informational purposes only and should not be considered "
+                "as investment advice. The calculations are based on assumptions and inputs provided "
+                "and may not reflect actual market conditions or future performance.",
+                self.styles['Warning']
+            ),
+            
+            Spacer(1, 0.3*inch),
+            
+            # Methodology notes
+            Paragraph("Methodology Notes", self._heading3),
+            Paragraph(
+                "• DCF valuations are sensitive to discount rate and growth assumptions\n"
+                "• Market multiples depend on the availability of comparable companies\n"
+                "• Scorecard and Berkus methods involve subjective scoring\n"
+                "• Risk assessments should be regularly updated\n"
+                "• VC method assumes specific exit scenarios",
+                self._normal
+            )
+        ])
     
     def _format_currency(self, amount: float) -> str:
         """Format currency values"""
-        if amount >= 1000000:
-            return f"€{amount/1000000:.1f}M"
-        elif amount >= 1000:
-            return f"€{amount/1000:.0f}K"
-        else:
-            return f"€{amount:,.0f}"
+        return _format_currency(amount)
     
-    def _create_error_pdf(self, error_message: str) -> BytesIO:
-        """Create error PDF when report generation fails"""
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
-        story = []
-        
-        story.append(Paragraph("PDF Generation Error", self.styles['Title']))
-        story.append(Spacer(1, 0.5*inch))
-        story.append(Paragraph(f"Error: {error_message}", self.styles['Normal']))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph(
-            "Please try again or contact support if the problem persists.",
-            self.styles['Normal']
-        ))
+    def _create_error_pdf(self, error_message: str, out: Optional[IO[bytes]] = None) -> Optional[BytesIO]:
+        """Create error PDF when report generation fails, written to out if given"""
+        buffer = BytesIO() if out is None else out
+        doc = SimpleDocTemplate(buffer, pagesize=A4, pageCompression=1)
+        story = [
+            Paragraph("PDF Generation Error", self._title),
+            Spacer(1, 0.5*inch),
+            Paragraph(f"Error: {error_message}", self._normal),
+            Spacer(1, 0.3*inch),
+            Paragraph(
+                "Please try again or contact support if the problem persists.",
+                self._normal
+            )
+        ]
         
         doc.build(story)
+        if out is not None:
+            return None
         buffer.seek(0)
         
         return buffer
     
     def _add_comprehensive_summary(self, story: List, calculation_history: List[Dict]):
         """Add comprehensive summary of all calculations"""
-        story.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
+        story.append(Paragraph("Executive Summary", self._section_header))
         
+        count = len(calculation_history)
         story.append(Paragraph(
-            f"This report presents a comprehensive startup valuation analysis using {len(calculation_history)} "
-            f"different calculation{'s' if len(calculation_history) > 1 else ''} performed between "
+            f"This report presents a comprehensive startup valuation analysis using {count} "
+            f"different calculation{'s' if count > 1 else ''} performed between "
             f"{calculation_history[0]['timestamp']} and {calculation_history[-1]['timestamp']}.",
-            self.styles['Normal']
+            self._normal
         ))
         
         story.append(Spacer(1, 0.2*inch))
@@ -805,12 +927,13 @@ class PDFGenerator:
         valuations = []
         
         for calc in calculation_history:
+            valuation = calc['valuation']
             summary_data.append([
                 calc['method'],
                 calc['timestamp'],
-                self._format_currency(calc['valuation'])
+                self._format_currency(valuation)
             ])
-            valuations.append(calc['valuation'])
+            valuations.append(valuation)
         
         # Add statistics row
         if valuations:
@@ -822,65 +945,47 @@ class PDFGenerator:
             summary_data.append(['Average', '', self._format_currency(avg_valuation)])
             summary_data.append(['Range', '', f"{self._format_currency(min_valuation)} - {self._format_currency(max_valuation)}"])
         
-        summary_table = Table(summary_data, colWidths=[2*inch, 2*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -4), colors.beige),
-            ('BACKGROUND', (0, -3), (-1, -1), colors.lightgrey),
-            ('FONTNAME', (0, -3), (-1, -1), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        # One row per calculation, so this can run over several pages
+        summary_table = LongTable(summary_data, colWidths=_THREE_COLUMN_COLS, repeatRows=1)
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         
-        story.append(summary_table)
-        story.append(Spacer(1, 0.3*inch))
+        story.extend([summary_table, Spacer(1, 0.3*inch)])
 
     def _add_detailed_analysis_tables_only(self, story: List, calculation_history: List[Dict]):
         """Add detailed analysis for each calculation with tables only (no charts)"""
-        story.append(PageBreak())
-        story.append(Paragraph("Detailed Analysis", self.styles['SectionHeader']))
+        story.extend([PageBreak(), Paragraph("Detailed Analysis", self._section_header)])
         
+        last_index = len(calculation_history) - 1
         for i, calc in enumerate(calculation_history):
-            story.append(Paragraph(f"{calc['method']} Analysis", self.styles['Heading3']))
-            story.append(Paragraph(f"Performed on: {calc['timestamp']}", self.styles['Normal']))
-            story.append(Paragraph(f"Valuation: {self._format_currency(calc['valuation'])}", self.styles['MetricValue']))
-            story.append(Spacer(1, 0.2*inch))
+            method = calc['method']
+            story.extend([
+                Paragraph(f"{method} Analysis", self._heading3),
+                Paragraph(f"Performed on: {calc['timestamp']}", self._normal),
+                Paragraph(f"Valuation: {self._format_currency(calc['valuation'])}", self._metric_value),
+                Spacer(1, 0.2*inch)
+            ])
             
             # Method-specific details (tables only, no charts)
-            if calc['method'] == "DCF":
-                self._add_dcf_analysis(story, calc['result'])
-            elif calc['method'] == "Market Multiples":
-                self._add_multiples_analysis(story, calc['result'], calc)
-            elif calc['method'] == "Scorecard":
-                self._add_scorecard_analysis(story, calc['result'])
-            elif calc['method'] == "Berkus":
-                self._add_berkus_analysis(story, calc['result'])
-            elif calc['method'] == "Risk Factor Summation":
-                self._add_risk_analysis(story, calc['result'])
-            elif calc['method'] == "Venture Capital":
-                self._add_vc_analysis(story, calc['result'], calc)
+            handler = _ANALYSIS_METHODS.get(method)
+            if handler:
+                getattr(self, handler)(story, calc['result'], calc)
             
-            if i < len(calculation_history) - 1:
+            if i < last_index:
                 story.append(Spacer(1, 0.3*inch))
 
     def _add_comparative_analysis(self, story: List, calculation_history: List[Dict]):
         """Add comparative analysis section"""
-        story.append(PageBreak())
-        story.append(Paragraph("Comparative Analysis", self.styles['SectionHeader']))
+        story.extend([PageBreak(), Paragraph("Comparative Analysis", self._section_header)])
         
         valuations = [calc['valuation'] for calc in calculation_history]
-        methods = [calc['method'] for calc in calculation_history]
+        methods = {calc['method'] for calc in calculation_history}
         
         # Valuation range analysis
         min_val = min(valuations)
         max_val = max(valuations)
         avg_val = sum(valuations) / len(valuations)
         
-        story.append(Paragraph("Valuation Range Analysis", self.styles['Heading3']))
+        story.append(Paragraph("Valuation Range Analysis", self._heading3))
         
         range_data = [
             ['Metric', 'Value'],
@@ -891,45 +996,23 @@ class PDFGenerator:
             ['Coefficient of Variation', f"{(max_val - min_val) / avg_val * 100:.1f}%" if avg_val > 0 else "N/A"]
         ]
         
-        range_table = Table(range_data, colWidths=[2.5*inch, 2.5*inch])
-        range_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        range_table = Table(range_data, colWidths=_TWO_COLUMN_COLS)
+        range_table.setStyle(_DETAIL_TABLE_STYLE)
         
-        story.append(range_table)
-        story.append(Spacer(1, 0.3*inch))
+        story.extend([range_table, Spacer(1, 0.3*inch)])
         
         # Method recommendations
-        story.append(Paragraph("Method Recommendations", self.styles['Heading3']))
+        story.append(Paragraph("Method Recommendations", self._heading3))
         
-        if 'DCF' in methods:
-            story.append(Paragraph(
-                "• DCF Method: Most suitable for companies with predictable cash flows and established business models.",
-                self.styles['Normal']
-            ))
-        
-        if 'Berkus' in methods:
-            story.append(Paragraph(
-                "• Berkus Method: Ideal for pre-revenue startups, focusing on risk reduction factors.",
-                self.styles['Normal']
-            ))
-        
-        if 'Market Multiples' in methods:
-            story.append(Paragraph(
-                "• Market Multiples: Provides market-based perspective, best used with comparable companies.",
-                self.styles['Normal']
-            ))
+        recommendations = [
+            recommendation for method, recommendation in _METHOD_RECOMMENDATIONS if method in methods
+        ]
+        if recommendations:
+            story.append(Paragraph("<br/>".join(recommendations), self._normal))
 
     def _add_chart_data_table(self, story: List, calc: Dict):
         """Add Plotly charts as images and data tables"""
-        story.append(Paragraph("Visual Analysis", self.styles['Heading4']))
+        story.append(Paragraph("Visual Analysis", self._heading4))
         
         method = calc['method']
         result = calc['result']
@@ -941,18 +1024,9 @@ class PDFGenerator:
             story.append(Spacer(1, 0.1*inch))
         
         # Add styled data tables
-        if method == "DCF":
-            self._add_dcf_chart_data(story, calc)
-        elif method == "Market Multiples":
-            self._add_multiples_chart_data(story, calc)
-        elif method == "Scorecard":
-            self._add_scorecard_chart_data(story, calc)
-        elif method == "Berkus":
-            self._add_berkus_chart_data(story, calc)
-        elif method == "Risk Factor Summation":
-            self._add_risk_chart_data(story, calc)
-        elif method == "Venture Capital":
-            self._add_vc_chart_data(story, calc)
+        handler = _CHART_DATA_METHODS.get(method)
+        if handler:
+            getattr(self, handler)(story, calc)
         
         story.append(Spacer(1, 0.2*inch))
 
@@ -974,15 +1048,7 @@ class PDFGenerator:
             dcf_data.append(['Terminal Value', '-', self._format_currency(result.get('terminal_pv', 0))])
             
             dcf_table = Table(dcf_data, colWidths=[1.2*inch, 1.8*inch, 1.8*inch])
-            dcf_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-            ]))
+            dcf_table.setStyle(_DATA_TABLE_STYLE)
             
             story.append(dcf_table)
 
@@ -1003,15 +1069,7 @@ class PDFGenerator:
             mult_data.append([sector_name, f"{multiples[metric_type]:.1f}x", is_used])
         
         mult_table = Table(mult_data, colWidths=[2.5*inch, 1.2*inch, 0.8*inch])
-        mult_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-        ]))
+        mult_table.setStyle(_DATA_TABLE_STYLE)
         
         story.append(mult_table)
 
@@ -1030,15 +1088,7 @@ class PDFGenerator:
             ])
         
         score_table = Table(score_data, colWidths=[2*inch, 0.8*inch, 0.8*inch, 1*inch])
-        score_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-        ]))
+        score_table.setStyle(_DATA_TABLE_STYLE)
         
         story.append(score_table)
 
@@ -1057,16 +1107,7 @@ class PDFGenerator:
             ])
         
         berkus_table = Table(berkus_data, colWidths=[3*inch, 0.8*inch, 1*inch, 0.8*inch])
-        berkus_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('WORDWRAP', (0, 0), (-1, -1), True)
-        ]))
+        berkus_table.setStyle(_WRAPPED_DATA_TABLE_STYLE)
         
         story.append(berkus_table)
 
@@ -1084,16 +1125,7 @@ class PDFGenerator:
             ])
         
         risk_table = Table(risk_data, colWidths=[3*inch, 0.8*inch, 1*inch])
-        risk_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('WORDWRAP', (0, 0), (-1, -1), True)
-        ]))
+        risk_table.setStyle(_WRAPPED_DATA_TABLE_STYLE)
         
         story.append(risk_table)
 
@@ -1112,15 +1144,7 @@ class PDFGenerator:
             vc_data.append(['Investment Needed', self._format_currency(result.get('investment_needed', 0))])
         
         vc_table = Table(vc_data, colWidths=[2.2*inch, 2.2*inch])
-        vc_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-        ]))
+        vc_table.setStyle(_LEFT_DATA_TABLE_STYLE)
         
         story.append(vc_table)
 
@@ -1133,11 +1157,10 @@ class PDFGenerator:
         total_value = result.get('valuation', 0)
         
         if total_value > 0:
-            operating_pct = (operating_value / total_value) * 100
-            terminal_pct = (terminal_value / total_value) * 100
+            operating_pct, terminal_pct = _component_percentages(operating_value, terminal_value, total_value)
             
             # Create a simple visual breakdown
-            story.append(Paragraph("Valuation Composition", self.styles['Heading4']))
+            story.append(Paragraph("Valuation Composition", self._heading4))
             
             composition_data = [
                 ['Component', 'Value', 'Percentage', 'Visual'],
@@ -1179,11 +1202,10 @@ class PDFGenerator:
         total_value = result.get('valuation', 0)
         
         if total_value > 0:
-            operating_pct = (operating_value / total_value) * 100
-            terminal_pct = (terminal_value / total_value) * 100
+            operating_pct, terminal_pct = _component_percentages(operating_value, terminal_value, total_value)
             
             # Create simple visual breakdown
-            story.append(Paragraph("Value Breakdown", self.styles['Heading4']))
+            story.append(Paragraph("Value Breakdown", self._heading4))
             
             composition_data = [
                 ['Component', 'Value', 'Percentage', 'Visual Bar'],
@@ -1226,7 +1248,7 @@ class PDFGenerator:
         metric_type = inputs.get('metric_type', 'Revenue')
         used_multiple = inputs.get('multiple', 0)
         
-        story.append(Paragraph("Sector Multiple Comparison", self.styles['Heading4']))
+        story.append(Paragraph("Sector Multiple Comparison", self._heading4))
         
         # Create visual comparison table
         comparison_data = [
@@ -1260,7 +1282,7 @@ class PDFGenerator:
         result = calc['result']
         criteria_analysis = result.get('criteria_analysis', {})
         
-        story.append(Paragraph("Scorecard Performance", self.styles['Heading4']))
+        story.append(Paragraph("Scorecard Performance", self._heading4))
         
         # Create performance visualization table
         perf_data = [['Criteria', 'Score', 'Performance', 'Visual Rating']]
@@ -1298,7 +1320,7 @@ class PDFGenerator:
         result = calc['result']
         breakdown = result.get('breakdown', {})
         
-        story.append(Paragraph("Berkus Value Breakdown", self.styles['Heading4']))
+        story.append(Paragraph("Berkus Value Breakdown", self._heading4))
         
         # Create value breakdown table
         berkus_data = [['Criteria', 'Score', 'Max Value', 'Assigned Value', 'Visual Progress']]
@@ -1340,7 +1362,7 @@ class PDFGenerator:
         result = calc['result']
         risk_analysis = result.get('risk_analysis', {})
         
-        story.append(Paragraph("Risk Factor Analysis", self.styles['Heading4']))
+        story.append(Paragraph("Risk Factor Analysis", self._heading4))
         
         # Create risk visualization table
         risk_data = [['Risk Factor', 'Rating', 'Impact', 'Adjustment', 'Visual Impact']]
@@ -1389,7 +1411,7 @@ class PDFGenerator:
         result = calc['result']
         inputs = calc['inputs']
         
-        story.append(Paragraph("Venture Capital Analysis", self.styles['Heading4']))
+        story.append(Paragraph("Venture Capital Analysis", self._heading4))
         
         exit_value = result.get('exit_value', 0)
         present_value = result.get('present_value', 0)
@@ -1443,20 +1465,14 @@ class PDFGenerator:
             chart_data = calc.get('chart_data', None)
             
             # Create ReportLab chart based on method and data
-            if method == "DCF":
-                return self._create_dcf_reportlab_chart(result, calc.get('inputs', {}))
-            elif method == "Market Multiples":
-                return self._create_multiples_reportlab_chart(result, calc.get('inputs', {}))
-            elif method == "Scorecard":
-                return self._create_scorecard_reportlab_chart(result)
-            elif method == "Berkus":
-                return self._create_berkus_reportlab_chart(result)
-            elif method == "Risk Factor Summation":
-                return self._create_risk_reportlab_chart(result)
-            elif method == "Venture Capital":
-                return self._create_vc_reportlab_chart(result, calc.get('inputs', {}))
-            else:
+            handler = _REPORTLAB_CHART_METHODS.get(method)
+            if handler is None:
                 return self._create_placeholder_chart(method)
+            
+            name, takes_inputs = handler
+            if takes_inputs:
+                return getattr(self, name)(result, calc.get('inputs', {}))
+            return getattr(self, name)(result)
                 
         except Exception as e:
             return self._create_error_chart(f"Chart generation failed: {str(e)}")
@@ -0,0 +1,291 @@
+"""
+Tests for the export manager's file formats
+Expected outputs were produced by the original pandas/ElementTree exporters
+"""
+
+import unittest
+import sys
+import os
+import json
+from datetime import datetime
+from io import BytesIO
+from unittest import mock
+
+import openpyxl
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import export_manager_simple
+from export_manager_simple import ExportManager
+
+
+class FixedDatetime(datetime):
+    """datetime whose now() is pinned so exports are reproducible"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 1, 2, 3, 4, 5)
+
+
+HISTORY = [
+    {
+        'timestamp': '2025-05-30 12:00:00', 'method': 'DCF', 'valuation': 1861496.51,
+        'inputs': {'cash_flows': [100000, 120000], 'discount_rate': 0.12, 'terminal_growth': 0.03},
+        'result': {'success': True, 'valuation': 1861496.51, 'operating_value': 514924.49, 'terminal_pv': 1346572.02}
+    },
+    {
+        'timestamp': '2025-05-31 09:30:00', 'method': 'Venture Capital', 'valuation': 0,
+        'inputs': {'required_return': 0.4, 'years_to_exit': 5},
+        'result': {'success': True, 'valuation': 0, 'exit_value': 25000000.0, 'present_value': 4648360.8}
+    },
+    {
+        'timestamp': None, 'method': 'Berkus', 'valuation': 2500.4,
+        'inputs': {'criteria_scores': {'concept & idea': 4}},
+        'result': {'success': False, 'breakdown': {'concept': {'score': 4, 'value': 400000}}, 'max_possible': 2500000}
+    }
+]
+
+EXPECTED_CSV = (
+    'Timestamp,Method,Valuation,Success,Operating_Value,Terminal_Value,Discount_Rate,Terminal_Growth,'
+    'Exit_Value,Present_Value,Required_Return,Years_to_Exit,Berkus_concept\n'
+    '2025-05-30 12:00:00,DCF,1861496.51,True,514924.49,1346572.02,0.12,0.03,,,,,\n'
+    '2025-05-31 09:30:00,Venture Capital,0.0,True,,,,,25000000.0,4648360.8,0.4,5.0,\n'
+    ',Berkus,2500.4,False,,,,,,,,,400000.0\n'
+)
+
+EXPECTED_XML = (
+    '<ValuationExport><Metadata><Timestamp>2026-01-02T03:04:05</Timestamp><Format>xml</Format>'
+    '<Version>1.0</Version><TotalCalculations>3</TotalCalculations><IncludeCharts>False</IncludeCharts>'
+    '</Metadata><Calculations>'
+    '<Calculation><Timestamp>2025-05-30 12:00:00</Timestamp><Method>DCF</Method>'
+    '<Valuation>1861496.51</Valuation><Success>True</Success>'
+    '<Inputs><cash_flows><Item_0>100000</Item_0><Item_1>120000</Item_1></cash_flows>'
+    '<discount_rate>0.12</discount_rate><terminal_growth>0.03</terminal_growth></Inputs>'
+    '<Result><success>True</success><valuation>1861496.51</valuation><operating_value>514924.49</operating_value>'
+    '<terminal_pv>1346572.02</terminal_pv></Result></Calculation>'
+    '<Calculation><Timestamp>2025-05-31 09:30:00</Timestamp><Method>Venture Capital</Method>'
+    '<Valuation>0</Valuation><Success>True</Success>'
+    '<Inputs><required_return>0.4</required_return><years_to_exit>5</years_to_exit></Inputs>'
+    '<Result><success>True</success><valuation>0</valuation><exit_value>25000000.0</exit_value>'
+    '<present_value>4648360.8</present_value></Result></Calculation>'
+    '<Calculation><Timestamp /><Method>Berkus</Method><Valuation>2500.4</Valuation><Success>False</Success>'
+    '<Inputs><criteria_scores><concept_&_idea>4</concept_&_idea></criteria_scores></Inputs>'
+    '<Result><success>False</success><breakdown><concept><score>4</score><value>400000</value></concept>'
+    '</breakdown><max_possible>2500000</max_possible></Result></Calculation>'
+    '</Calculations></ValuationExport>'
+)
+
+EXPECTED_TXT = """STARTUP VALUATION CALCULATOR - EXPORT REPORT
+============================================================
+Generated: 2026-01-02 03:04:05
+Total Calculations: 3
+
+CALCULATION #1
+------------------------------
+Timestamp: 2025-05-30 12:00:00
+Method: DCF
+Valuation: $1,861,496.51
+Success: True
+
+Inputs:
+  cash_flows: [100000, 120000]
+  discount_rate: 0.12
+  terminal_growth: 0.03
+
+Results:
+  valuation: $1,861,496.51
+  operating_value: $514,924.49
+  terminal_pv: 1346572.02
+
+CALCULATION #2
+------------------------------
+Timestamp: 2025-05-31 09:30:00
+Method: Venture Capital
+Valuation: $0.00
+Success: True
+
+Inputs:
+  required_return: 0.4
+  years_to_exit: 5
+
+Results:
+  valuation: $0.00
+  exit_value: $25,000,000.00
+  present_value: $4,648,360.80
+
+CALCULATION #3
+------------------------------
+Timestamp: None
+Method: Berkus
+Valuation: $2,500.40
+Success: False
+
+Inputs:
+  criteria_scores: {'concept & idea': 4}
+
+Results:
+  breakdown: {'concept': {'score': 4, 'value': 400000}}
+  max_possible: 2500000
+
+SUMMARY STATISTICS
+------------------------------
+Average Valuation: $930,748.26
+Median Valuation: $1,861,496.51
+Min Valuation: $0.00
+Max Valuation: $1,861,496.51"""
+
+EXCEL_HEADER = (
+    'Timestamp', 'Method', 'Valuation', 'Success', 'Operating_Value', 'Terminal_Value', 'Discount_Rate',
+    'Terminal_Growth', 'Exit_Value', 'Present_Value', 'Required_Return', 'Years_to_Exit', 'Berkus_concept'
+)
+EXPECTED_EXCEL_ROWS = [
+    EXCEL_HEADER,
+    ('2025-05-30 12:00:00', 'DCF', 1861496.51, True, 514924.49, 1346572.02, 0.12, 0.03,
+     None, None, None, None, None),
+    ('2025-05-31 09:30:00', 'Venture Capital', 0, True, None, None, None, None,
+     25000000, 4648360.8, 0.4, 5, None),
+    (None, 'Berkus', 2500.4, False, None, None, None, None, None, None, None, None, 400000)
+]
+
+
+class ExportTestCase(unittest.TestCase):
+    """Base case exporting with a pinned generation time"""
+    
+    def setUp(self):
+        patcher = mock.patch.object(export_manager_simple, 'datetime', FixedDatetime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = ExportManager()
+    
+    def export(self, history, format_type):
+        return self.manager.export_calculation_data(history, format_type).getvalue()
+
+
+class TestCSVExport(ExportTestCase):
+    """Test cases for CSV export"""
+    
+    def test_matches_original_output(self):
+        """Test byte-for-byte output, including pandas' float upcast of sparse columns"""
+        self.assertEqual(self.export(HISTORY, 'csv').decode('utf-8'), EXPECTED_CSV)
+    
+    def test_missing_values_are_blank(self):
+        """Test that NaN and None are written as empty fields"""
+        history = [dict(HISTORY[0], valuation=float('nan'), timestamp=None)]
+        line = self.export(history, 'csv').decode('utf-8').splitlines()[1]
+        self.assertTrue(line.startswith(',DCF,,True,'))
+    
+    def test_empty_history(self):
+        """Test that an empty history exports an empty file"""
+        self.assertEqual(self.export([], 'csv'), b'')
+
+
+class TestXMLExport(ExportTestCase):
+    """Test cases for XML export"""
+    
+    def test_matches_original_output(self):
+        """Test byte-for-byte output against the ElementTree serialization"""
+        self.assertEqual(self.export(HISTORY, 'xml').decode('utf-8'), EXPECTED_XML)
+    
+    def test_escapes_text(self):
+        """Test that markup characters in values are escaped"""
+        history = [dict(HISTORY[0], method='A & B <C>')]
+        self.assertIn(b'<Method>A &amp; B &lt;C&gt;</Method>', self.export(history, 'xml'))
+    
+    def test_empty_history(self):
+        """Test that an empty history still has the metadata and an empty calculation list"""
+        self.assertTrue(self.export([], 'xml').endswith(b'<Calculations /></ValuationExport>'))
+
+
+class TestExcelExport(ExportTestCase):
+    """Test cases for Excel export"""
+    
+    def sheet_rows(self, history):
+        workbook = openpyxl.load_workbook(BytesIO(self.export(history, 'excel')))
+        self.assertEqual(workbook.sheetnames, ['Valuations'])
+        return list(workbook['Valuations'].iter_rows(values_only=True))
+    
+    def test_matches_original_cells(self):
+        """Test that every cell matches the pandas-written workbook"""
+        self.assertEqual(self.sheet_rows(HISTORY), EXPECTED_EXCEL_ROWS)
+    
+    def test_non_finite_values(self):
+        """Test that NaN is left blank and infinities are written as text"""
+        history = [dict(HISTORY[0], valuation=float('nan'),
+                        result=dict(HISTORY[0]['result'], operating_value=float('inf'), terminal_pv=float('-inf')))]
+        row = self.sheet_rows(history)[1]
+        self.assertEqual(row[2:6], (None, True, 'inf', '-inf'))
+    
+    def test_large_export_uses_constant_memory(self):
+        """Test that exports past the in-memory threshold still hold every row"""
+        history = HISTORY[:1] * (export_manager_simple._EXCEL_IN_MEMORY_ROWS + 1)
+        self.assertEqual(len(self.sheet_rows(history)), len(history) + 1)
+    
+    def test_empty_history(self):
+        """Test that an empty history exports an empty file"""
+        self.assertEqual(self.export([], 'excel'), b'')
+
+
+class TestTXTExport(ExportTestCase):
+    """Test cases for plain text export"""
+    
+    def test_matches_original_output(self):
+        """Test byte-for-byte output, including the summary statistics"""
+        self.assertEqual(self.export(HISTORY, 'txt').decode('utf-8'), EXPECTED_TXT)
+    
+    def test_upper_median(self):
+        """Test that even-sized histories report the upper of the two middle values"""
+        history = [dict(HISTORY[0], valuation=value) for value in (4000, 1000, 3000, 2000)]
+        self.assertIn('Median Valuation: $3,000.00', self.export(history, 'txt').decode('utf-8'))
+    
+    def test_non_str_result_keys(self):
+        """Test that result fields with non-str keys are written as plain values"""
+        result = {**HISTORY[0]['result'], 1: 'x', 2: None}
+        text = self.export([dict(HISTORY[0], result=result)], 'txt').decode('utf-8')
+        self.assertIn('  1: x\n  2: None\n', text)
+    
+    def test_no_successful_calculations(self):
+        """Test that the statistics block is left empty without successful calculations"""
+        text = self.export(HISTORY[2:], 'txt').decode('utf-8')
+        self.assertTrue(text.endswith('SUMMARY STATISTICS\n' + '-' * 30))
+
+
+class TestExportAllFormats(ExportTestCase):
+    """Test cases for exporting every format in one call"""
+    
+    def test_matches_single_format_exports(self):
+        """Test that each format matches its own export, with CSV and Excel sharing one table"""
+        exports = self.manager.export_all_formats(HISTORY)
+        
+        self.assertEqual(sorted(exports), sorted(self.manager.supported_formats))
+        for format_type in ('csv', 'json', 'xml', 'txt'):
+            self.assertEqual(exports[format_type].getvalue(), self.export(HISTORY, format_type), format_type)
+        workbook = openpyxl.load_workbook(exports['excel'])
+        self.assertEqual(list(workbook['Valuations'].iter_rows(values_only=True)), EXPECTED_EXCEL_ROWS)
+    
+    def test_empty_history(self):
+        """Test that an empty history still yields every format"""
+        exports = self.manager.export_all_formats([])
+        self.assertEqual(exports['csv'].getvalue(), b'')
+        self.assertEqual(exports['excel'].getvalue(), b'')
+
+
+@unittest.skipIf(export_manager_simple.msgpack is None, "msgpack is not installed")
+class TestMessagePackExport(ExportTestCase):
+    """Test cases for the optional MessagePack export"""
+    
+    def test_offered_when_installed(self):
+        """Test that the format is listed alongside the built-in ones"""
+        self.assertIn('msgpack', self.manager.supported_formats)
+    
+    def test_matches_json_document(self):
+        """Test that the packed document holds the same calculations as the JSON export"""
+        packed = export_manager_simple.msgpack.unpackb(self.export(HISTORY, 'msgpack'))
+        document = json.loads(self.export(HISTORY, 'json'))
+        
+        self.assertEqual(packed['export_metadata']['format'], 'msgpack')
+        self.assertEqual(packed['calculations'], document['calculations'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Tests for the PDF chart generator's render cache and threaded rendering
+"""
+
+import unittest
+import sys
+import os
+import threading
+from unittest import mock
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from valuation_calculator import ValuationCalculator
+import pdf_chart_generator
+from pdf_chart_generator import PDFChartGenerator
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _chart_data(method, result, inputs=None):
+    return {'method': method, 'result': result, 'inputs': inputs or {}}
+
+
+class TestChartCache(unittest.TestCase):
+    """Test cases for the process-wide chart PNG cache"""
+    
+    def setUp(self):
+        calculator = ValuationCalculator()
+        cash_flows = [100000, 120000, 144000, 172800, 207360]
+        self.dcf = _chart_data('DCF', calculator.dcf_valuation(cash_flows, 0.2, 0.12, 0.03),
+                               {'cash_flows': cash_flows, 'discount_rate': 0.12})
+        PDFChartGenerator().reset()
+    
+    def test_cache_is_shared_across_generators(self):
+        """Test that a chart rendered by one generator is served to the next"""
+        with mock.patch.object(PDFChartGenerator, '_save_chart_to_buffer',
+                               autospec=True,
+                               side_effect=PDFChartGenerator._save_chart_to_buffer) as save:
+            first = PDFChartGenerator().create_dcf_chart(self.dcf).getvalue()
+            second = PDFChartGenerator().create_dcf_chart(self.dcf).getvalue()
+        
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(first, second)
+    
+    def test_close_keeps_rendered_charts(self):
+        """Test that closing a generator after a report keeps the PNG cache"""
+        generator = PDFChartGenerator()
+        generator.create_dcf_chart(self.dcf)
+        generator.close()
+        
+        self.assertEqual(len(pdf_chart_generator._chart_png_cache), 1)
+    
+    def test_cache_is_bounded(self):
+        """Test that the oldest chart is evicted once the cache is full"""
+        with mock.patch.object(pdf_chart_generator, '_CHART_CACHE_SIZE', 2):
+            generator = PDFChartGenerator()
+            for rate in (0.10, 0.11, 0.12):
+                data = dict(self.dcf, inputs={'discount_rate': rate})
+                generator.create_dcf_chart(data)
+        
+        self.assertEqual(len(pdf_chart_generator._chart_png_cache), 2)
+
+
+class TestRenderEach(unittest.TestCase):
+    """Test cases for rendering appendix charts on the shared thread pool"""
+    
+    def setUp(self):
+        calculator = ValuationCalculator()
+        cash_flows = [100000, 120000, 144000, 172800, 207360]
+        self.dcf = _chart_data('DCF', calculator.dcf_valuation(cash_flows, 0.2, 0.12, 0.03))
+        self.berkus = _chart_data('Berkus', calculator.berkus_valuation({
+            'concept': 4, 'prototype': 3, 'team': 5,
+            'strategic_relationships': 2, 'product_rollout': 1
+        }))
+        self.risk = _chart_data('Risk Factor Summation', {'valuation': 2000000})
+        self.generator = PDFChartGenerator()
+        self.generator.reset()
+    
+    def test_futures_follow_input_order(self):
+        """Test one future per entry, in order, with None for methods without a chart"""
+        futures = self.generator.render_each([self.berkus, self.risk, self.dcf])
+        
+        self.assertEqual(len(futures), 3)
+        self.assertIsNone(futures[1])
+        self.assertEqual(futures[0].result(), self.generator.create_berkus_chart(self.berkus).getvalue())
+        self.assertEqual(futures[2].result(), self.generator.create_dcf_chart(self.dcf).getvalue())
+        self.assertTrue(futures[2].result().startswith(PNG_SIGNATURE))
+    
+    def test_identical_entries_share_one_render(self):
+        """Test that repeated calculations with the same inputs render once"""
+        repeat = dict(self.dcf)
+        with mock.patch.object(pdf_chart_generator, '_render_chart_in_thread',
+                               wraps=pdf_chart_generator._render_chart_in_thread) as render:
+            futures = self.generator.render_each([self.dcf, self.berkus, repeat])
+            results = [future.result() for future in futures]
+        
+        self.assertEqual(render.call_count, 2)
+        self.assertIs(futures[0], futures[2])
+        self.assertEqual(results[0], results[2])
+    
+    def test_no_chart_methods(self):
+        """Test that entries without a matplotlib chart submit nothing"""
+        self.assertEqual(self.generator.render_each([self.risk]), [None])
+        self.assertEqual(self.generator.render_each([]), [])
+    
+    def test_each_render_thread_warms_up_once(self):
+        """Test that a new render thread loads its fonts before its first chart only"""
+        def render_twice():
+            pdf_chart_generator._render_chart_in_thread('DCF', self.dcf)
+            pdf_chart_generator._render_chart_in_thread('Berkus', self.berkus)
+        
+        with mock.patch.object(PDFChartGenerator, '_warm_up_text_rendering', autospec=True) as warm_up:
+            thread = threading.Thread(target=render_twice)
+            thread.start()
+            thread.join()
+        
+        self.assertEqual(warm_up.call_count, 1)
+
+
+class TestFigureReuse(unittest.TestCase):
+    """Test cases for drawing every chart on the generator's reusable figures"""
+    
+    def setUp(self):
+        calculator = ValuationCalculator()
+        cash_flows = [100000, 120000, 144000, 172800, 207360]
+        self.dcf = _chart_data('DCF', calculator.dcf_valuation(cash_flows, 0.2, 0.12, 0.03))
+        self.berkus = _chart_data('Berkus', calculator.berkus_valuation({
+            'concept': 4, 'prototype': 3, 'team': 5,
+            'strategic_relationships': 2, 'product_rollout': 1
+        }))
+        self.generator = PDFChartGenerator()
+    
+    def _render_uncached(self, render, data):
+        pdf_chart_generator._chart_png_cache.clear()
+        return render(data).getvalue()
+    
+    def test_reused_figure_matches_first_render(self):
+        """Test that a chart drawn after others is identical to its first drawing"""
+        first = self._render_uncached(self.generator.create_dcf_chart, self.dcf)
+        self._render_uncached(self.generator.create_berkus_chart, self.berkus)
+        again = self._render_uncached(self.generator.create_dcf_chart, self.dcf)
+        
+        self.assertEqual(first, again)
+    
+    def test_single_axes_reuses_cleared_figure(self):
+        """Test that single_axes hands back the same figure with empty axes"""
+        fig, ax = self.generator.single_axes((8, 5))
+        ax.bar(['a'], [1])
+        again_fig, again_ax = self.generator.single_axes((8, 5))
+        
+        self.assertIs(again_fig, fig)
+        self.assertIs(again_ax, ax)
+        self.assertEqual(len(ax.patches), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
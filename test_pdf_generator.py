@@ -0,0 +1,126 @@
+"""
+Tests for the PDF report generator helpers
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_generator import PDFGenerator, _format_currency, _MAX_CHART_FAILURES
+
+
+class TestFormatCurrency(unittest.TestCase):
+    """Test cases for report currency formatting"""
+    
+    def test_tiers(self):
+        """Test plain, thousand and million euro tiers"""
+        self.assertEqual(_format_currency(0), "€0")
+        self.assertEqual(_format_currency(750), "€750")
+        self.assertEqual(_format_currency(25000), "€25K")
+        self.assertEqual(_format_currency(2500000), "€2.5M")
+    
+    def test_fractional_amounts_are_not_rounded_first(self):
+        """Test that the tier and label come from the exact amount"""
+        self.assertEqual(_format_currency(2500.4), "€3K")
+        self.assertEqual(_format_currency(999.6), "€1,000")
+        self.assertEqual(_format_currency(999999.9), "€1000K")
+        self.assertEqual(_format_currency(1000000), "€1.0M")
+    
+    def test_int_and_float_share_output(self):
+        """Test that equal int and float amounts format the same"""
+        self.assertEqual(_format_currency(1500), _format_currency(1500.0))
+    
+    def test_non_finite_amounts(self):
+        """Test that non-finite amounts do not raise"""
+        self.assertEqual(_format_currency(float('nan')), "€nan")
+        self.assertEqual(_format_currency(float('inf')), "€infM")
+
+
+
+class TestChartsAppendixFailures(unittest.TestCase):
+    """Test cases for skipping appendix charts after repeated failures"""
+    
+    def setUp(self):
+        self.generator = PDFGenerator()
+        self.chart_generator = mock.Mock()
+        # Replace the lazily created chart generator
+        self.generator.__dict__['chart_generator'] = self.chart_generator
+    
+    def _history(self, methods):
+        return [
+            {'method': method, 'timestamp': f'2025-01-0{i + 1}', 'inputs': {},
+             'result': {'valuation': 1000000 + i}}
+            for i, method in enumerate(methods)
+        ]
+    
+    def _texts(self, story):
+        return [flowable.getPlainText() for flowable in story if hasattr(flowable, 'getPlainText')]
+    
+    def test_empty_charts_stop_rendering(self):
+        """Test that charts coming back empty count as failures and cancel the rest"""
+        history = self._history(['DCF'] * 5)
+        futures = [mock.Mock(**{'result.return_value': None}) for _ in history]
+        self.chart_generator.render_each.return_value = futures
+        
+        story = []
+        self.generator._add_charts_appendix(story, history)
+        
+        waited = [future for future in futures if future.result.called]
+        self.assertEqual(len(waited), _MAX_CHART_FAILURES)
+        for future in futures[_MAX_CHART_FAILURES:]:
+            future.cancel.assert_called_once()
+        self.assertEqual(
+            sum('not available' in text for text in self._texts(story)), len(history)
+        )
+    
+    def test_visual_charts_stop_after_failures(self):
+        """Test that the self-drawn charts are skipped once earlier charts failed"""
+        history = self._history(['Risk Factor Summation', 'Risk Factor Summation', 'Venture Capital'])
+        self.chart_generator.render_each.return_value = [None] * len(history)
+        
+        with mock.patch.object(PDFGenerator, '_create_risk_factor_visual_chart', return_value=None) as risk, \
+                mock.patch.object(PDFGenerator, '_create_vc_method_visual_chart') as vc:
+            self.generator._add_charts_appendix([], history)
+        
+        self.assertEqual(risk.call_count, 2)
+        vc.assert_not_called()
+    
+    def test_success_resets_failures(self):
+        """Test that only consecutive failures stop the charts"""
+        history = self._history(['DCF'] * 4)
+        outcomes = [None, b'png', None, b'png']
+        futures = [mock.Mock(**{'result.return_value': png}) for png in outcomes]
+        self.chart_generator.render_each.return_value = futures
+        
+        with mock.patch.object(PDFGenerator, '_add_chart_interpretation'):
+            self.generator._add_charts_appendix([], history)
+        
+        self.assertTrue(all(future.result.called for future in futures))
+        self.assertEqual(self.chart_generator.create_reportlab_image.call_count, 2)
+
+
+
+class TestReportFlowables(unittest.TestCase):
+    """Test cases for flowables that must not be shared between report builds"""
+    
+    def _shared_flowables(self, add_section):
+        first, second = [], []
+        add_section(PDFGenerator(), first)
+        add_section(PDFGenerator(), second)
+        return {id(flowable) for flowable in first} & {id(flowable) for flowable in second}
+    
+    def test_title_page_is_built_per_report(self):
+        """Test that each report gets its own title page flowables"""
+        self.assertEqual(self._shared_flowables(PDFGenerator._add_title_page), set())
+    
+    def test_appendices_are_built_per_report(self):
+        """Test that each report gets its own appendix flowables"""
+        self.assertEqual(self._shared_flowables(PDFGenerator._add_appendices), set())
+
+
+if __name__ == '__main__':
+    unittest.main()